@@ -1,7 +1,23 @@
+import argparse
 import json
 import random
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from itertools import repeat
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+
+try:
+    import orjson  # 高速JSONエンコーダ（未インストール時はujson、標準jsonの順に使用）
+except ImportError:
+    orjson = None
+
+try:
+    import ujson  # orjsonが使えない環境向けのC実装エンコーダ
+except ImportError:
+    ujson = None
 
 # ============================================================================
 # 設定変数 - 実行前にこれらの値を変更してください
@@ -17,6 +33,16 @@ SENSORS_PER_ROOM = 20
 DATA_POINTS_PER_ROOM = 1000
 ERROR_RATE = 0.25  # 25%
 
+# 部屋単位のデータ生成に使うプロセス数（1の場合は逐次生成）
+NUM_WORKERS = 1
+
+# 乱数シード（Noneの場合は実行ごとにランダム）
+RANDOM_SEED = None
+
+# 温度の範囲（0.1℃単位の整数で指定: 40 = 4.0℃, 80 = 8.0℃）
+TEMPERATURE_MIN_TENTHS = 40
+TEMPERATURE_MAX_TENTHS = 80
+
 # 出力ファイル名設定
 OUTPUT_FILES = {
     "dynamodb_format": "iot_test_data_dynamodb.json",
@@ -24,44 +50,144 @@ OUTPUT_FILES = {
     "batch_write_format": "batch_write_request.json"
 }
 
+# 出力ファイルの整形（インデント）設定
+# batch-write形式はaws cliに直接渡すだけなので、既定ではコンパクトなJSONで出力する
+PRETTY_PRINT = {
+    "dynamodb_format": True,
+    "normal_format": True,
+    "batch_write_format": False
+}
+
+# ストリーミング書き出し時の書き込みバッファサイズ（1 MiB）
+WRITE_BUFFER_SIZE = 1024 * 1024
+
 # データ生成開始時刻
 START_TIME = datetime(2025, 8, 1, 0, 0, 0)
 
 
+# 温度は小数第1位までの有限個の値しか取らないため、数値と文字列表現を事前に作成しておく
+TEMPERATURE_VALUES = [i / 10 for i in range(TEMPERATURE_MIN_TENTHS, TEMPERATURE_MAX_TENTHS + 1)]
+TEMPERATURE_STR = {value: f"{value:.1f}" for value in TEMPERATURE_VALUES}
+
+# 値が共通するDynamoDB型ラッパーは全アイテムで同じ辞書を共有する
+# 共有しているため、生成後のアイテムは変更せず読み取り専用として扱うこと
+NULL_TEMPERATURE_ATTR = {"NULL": True}
+TEMPERATURE_ATTRS = {value: {"N": text} for value, text in TEMPERATURE_STR.items()}
+STATUS_ATTRS = {"ok": {"S": "ok"}, "sensor_error": {"S": "sensor_error"}}
+
+
+# ============================================================================
+# データ表現
+# ============================================================================
+
+
+@dataclass
+class TelemetryColumns:
+    """
+    テストデータの列指向（Struct of Arrays）表現
+    各列は同じ長さで、同じインデックスが1件のデータポイントに対応する
+    DynamoDB形式の辞書はファイル書き出し時にのみ生成する
+    """
+    device_ids: List[str]
+    room_ids: List[str]
+    timestamps: List[str]
+    temperatures: List[Optional[float]]  # sensor_errorの場合はNone
+    statuses: List[str]
+
+    def __len__(self) -> int:
+        return len(self.device_ids)
+
+    def iter_dynamodb_items(self) -> Iterator[Dict[str, Any]]:
+        """
+        DynamoDB形式のデータポイントを1件ずつ生成
+        device_id・room_id・temperature・device_statusの型ラッパー辞書はアイテム間で共有されるため、
+        生成されたアイテムは読み取り専用として扱うこと
+        """
+        device_attrs = {device_id: {"S": device_id} for device_id in set(self.device_ids)}
+        room_attrs = {room_id: {"S": room_id} for room_id in set(self.room_ids)}
+        status_attrs = {status: STATUS_ATTRS.get(status) or {"S": status} for status in set(self.statuses)}
+        temperature_attr = TEMPERATURE_ATTRS.get
+        for device_id, room_id, timestamp, temperature, status in zip(
+                self.device_ids, self.room_ids, self.timestamps, self.temperatures, self.statuses):
+            yield {
+                "device_id": device_attrs[device_id],
+                "room_id": room_attrs[room_id],
+                "timestamp": {"S": timestamp},
+                "temperature": NULL_TEMPERATURE_ATTR if temperature is None else (
+                        temperature_attr(temperature) or {"N": str(temperature)}),
+                "device_status": status_attrs[status]
+            }
+
+    def iter_normal_items(self) -> Iterator[Dict[str, Any]]:
+        """通常のJSON形式のデータポイントを列から直接1件ずつ生成"""
+        for device_id, room_id, timestamp, temperature, status in zip(
+                self.device_ids, self.room_ids, self.timestamps, self.temperatures, self.statuses):
+            yield {
+                "device_id": device_id,
+                "room_id": room_id,
+                "timestamp": timestamp,
+                "temperature": temperature,
+                "device_status": status
+            }
+
+
 # ============================================================================
 # データ生成関数
 # ============================================================================
 
 
-def convert_dynamodb_to_normal_format(dynamodb_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def dumps_json(data: Any, pretty: bool = True) -> bytes:
     """
-    DynamoDB形式のデータを通常のJSON形式に変換
+    JSON（UTF-8バイト列）にエンコード
+    利用可能なエンコーダをorjson、ujson、標準jsonの順に使用する
+    pretty=Falseの場合は空白を含まないコンパクトなJSONを出力する
     """
-    normal_data = []
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2) if pretty else orjson.dumps(data)
+    if ujson is not None:
+        # ujsonはindent未指定時にコンパクトなJSONを出力する
+        text = ujson.dumps(data, indent=2, ensure_ascii=False) if pretty else ujson.dumps(data, ensure_ascii=False)
+    elif pretty:
+        text = json.dumps(data, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+    return text.encode('utf-8')
+
+
+def dumps_compact(data: Any) -> bytes:
+    """コンパクトなJSON（UTF-8バイト列）にエンコード"""
+    return dumps_json(data, pretty=False)
 
-    for item in dynamodb_data:
-        normal_item = {}
 
-        for key, value in item.items():
-            if isinstance(value, dict):
-                if "S" in value:  # String type
-                    normal_item[key] = value["S"]
-                elif "N" in value:  # Number type
-                    normal_item[key] = float(value["N"])
-                elif "NULL" in value and value["NULL"]:  # Null type
-                    normal_item[key] = None
-                else:
-                    normal_item[key] = value
-            else:
-                normal_item[key] = value
+def generate_timestamps(start_time: datetime, count: int) -> List[str]:
+    """
+    開始時刻から1秒間隔のUTCタイムスタンプ文字列（YYYY-MM-DDTHH:MM:SSZ）を一括生成
+    日付部分は日ごとに1回だけ整形し、時刻部分は整数演算で組み立てる
+    """
+    timestamps = []
+    current_date = start_time.date()
+    second_of_day = start_time.hour * 3600 + start_time.minute * 60 + start_time.second
+    remaining = count
+
+    while remaining > 0:
+        date_prefix = current_date.isoformat()
+        day_count = min(remaining, 86400 - second_of_day)
 
-        normal_data.append(normal_item)
+        timestamps.extend(
+            f"{date_prefix}T{sec // 3600:02d}:{sec // 60 % 60:02d}:{sec % 60:02d}Z"
+            for sec in range(second_of_day, second_of_day + day_count)
+        )
 
-    return normal_data
+        # 日付が変わる場合は翌日の0時から継続
+        remaining -= day_count
+        second_of_day = 0
+        current_date += timedelta(days=1)
 
+    return timestamps
 
-def generate_device_error_patterns(devices: List[str], data_points_per_device: int, error_rate: float) -> Dict[
-    str, List[bool]]:
+
+def generate_device_error_patterns(devices: List[str], data_points_per_device: int, error_rate: float,
+                                   rng: Optional[random.Random] = None) -> Dict[str, List[bool]]:
     """
     各デバイスに対して個別にエラーパターンを生成
 
@@ -69,6 +195,7 @@ def generate_device_error_patterns(devices: List[str], data_points_per_device: i
         devices: デバイスIDのリスト
         data_points_per_device: デバイスあたりのデータポイント数
         error_rate: エラー率 (0.0-1.0)
+        rng: 使用する乱数生成器（省略時はrandomモジュールのグローバル状態を使用）
 
     Returns:
         Dict[str, List[bool]]: デバイスIDをキーとするエラーパターン辞書
@@ -79,6 +206,7 @@ def generate_device_error_patterns(devices: List[str], data_points_per_device: i
     print(f"  - エラー率: {error_rate * 100}%")
 
     device_error_patterns = {}
+    shuffle = (rng or random).shuffle
 
     for device in devices:
         # 各デバイスの正確なエラー数を計算
@@ -89,7 +217,7 @@ def generate_device_error_patterns(devices: List[str], data_points_per_device: i
         error_pattern = [True] * error_count + [False] * normal_count
 
         # パターンをシャッフルしてランダム性を保持
-        random.shuffle(error_pattern)
+        shuffle(error_pattern)
 
         device_error_patterns[device] = error_pattern
 
@@ -102,9 +230,41 @@ def generate_device_error_patterns(devices: List[str], data_points_per_device: i
     return device_error_patterns
 
 
-def generate_test_data() -> List[Dict[str, Any]]:
+def _generate_room(task: tuple) -> TelemetryColumns:
+    """
+    1部屋分のテストデータを生成（プロセスプールのワーカーからも呼び出される）
+
+    Args:
+        task: (部屋ID, 部屋内センサーリスト, センサーごとのエラーパターン, 開始オフセット秒, 乱数シード)
+
+    Returns:
+        TelemetryColumns: 部屋内のデータポイント（sensor_errorの場合はtemperatureがNone）
+    """
+    room, room_sensors, room_patterns, start_offset, seed = task
+    rng = random.Random(seed)
+    cycles = len(room_patterns[0]) if room_patterns else 0
+    room_data_count = cycles * len(room_sensors)
+
+    # サイクル番号がそのままデバイス別データポイントのインデックスになる
+    row_errors = [pattern[cycle] for cycle in range(cycles) for pattern in room_patterns]
+
+    # 取り得る温度値の表から部屋分まとめて一様に抽出する
+    temperatures = rng.choices(TEMPERATURE_VALUES, k=room_data_count)
+
+    return TelemetryColumns(
+        device_ids=room_sensors * cycles,
+        room_ids=[room] * room_data_count,
+        timestamps=generate_timestamps(START_TIME + timedelta(seconds=start_offset), room_data_count),
+        temperatures=[None if is_error else temperature
+                      for temperature, is_error in zip(temperatures, row_errors)],
+        statuses=["sensor_error" if is_error else "ok" for is_error in row_errors]
+    )
+
+
+def generate_test_data(verbose: bool = False) -> TelemetryColumns:
     """
     API仕様に基づくテストデータ生成
+    verbose=Trueの場合のみ部屋ごとの進捗を表示する
 
     仕様:
     - 設定可能なデータ件数
@@ -141,9 +301,12 @@ def generate_test_data() -> List[Dict[str, Any]]:
     print("センサーを部屋に配置中...")
     room_sensor_mapping = {}
 
+    # 乱数はモジュールのグローバル状態ではなく専用のRandomインスタンスから引く
+    rng = random.Random(RANDOM_SEED)
+
     # センサーリストをシャッフルして順番をランダム化
     shuffled_sensors = sensors.copy()
-    random.shuffle(shuffled_sensors)
+    rng.shuffle(shuffled_sensors)
 
     # 各部屋に指定数ずつ順番に割り当て
     for i, room in enumerate(rooms):
@@ -151,186 +314,224 @@ def generate_test_data() -> List[Dict[str, Any]]:
         end_idx = start_idx + SENSORS_PER_ROOM
         room_sensors = shuffled_sensors[start_idx:end_idx]
         room_sensor_mapping[room] = room_sensors
-        print(f"  {room}: {len(room_sensors)}個のセンサーを配置")
+        if verbose:
+            print(f"  {room}: {len(room_sensors)}個のセンサーを配置")
 
     # 各デバイスのエラーパターンを事前に生成
-    device_error_patterns = generate_device_error_patterns(sensors, data_points_per_device, ERROR_RATE)
+    device_error_patterns = generate_device_error_patterns(sensors, data_points_per_device, ERROR_RATE, rng)
 
     # テストデータ生成
     print("テストデータ生成中...")
-    test_data = []
-    current_timestamp = START_TIME
-    total_generated = 0
-
-    # デバイス別データポイントカウンター
-    device_data_counters = {device: 0 for device in sensors}
-
-    for room_idx, room in enumerate(rooms):
-        print(f"  部屋 {room} ({room_idx + 1}/{len(rooms)}) のデータ生成中...")
-        room_sensors = room_sensor_mapping[room]
-        room_data_count = 0
-
-        # 各部屋で指定数のデータポイント生成
-        cycles = DATA_POINTS_PER_ROOM // SENSORS_PER_ROOM
-
-        for cycle in range(cycles):
-            if cycle % 10 == 0:  # 進捗表示
-                print(f"    サイクル {cycle + 1}/{cycles} 完了")
-
-            for sensor in room_sensors:
-                if room_data_count >= DATA_POINTS_PER_ROOM:
-                    break
-
-                # 該当デバイスのエラーパターンから現在のデータポイントのエラー状態を取得
-                device_data_index = device_data_counters[sensor]
-                is_error = device_error_patterns[sensor][device_data_index]
-                device_data_counters[sensor] += 1
-
-                if is_error:
-                    # sensor_errorの場合（temperatureはnull）
-                    data_point = {
-                        "device_id": {"S": sensor},
-                        "room_id": {"S": room},
-                        "timestamp": {"S": current_timestamp.strftime("%Y-%m-%dT%H:%M:%SZ")},
-                        "temperature": {"NULL": True},
-                        "device_status": {"S": "sensor_error"}
-                    }
-                else:
-                    # 正常データの場合
-                    temperature = round(random.uniform(4.0, 8.0), 1)
-                    data_point = {
-                        "device_id": {"S": sensor},
-                        "room_id": {"S": room},
-                        "timestamp": {"S": current_timestamp.strftime("%Y-%m-%dT%H:%M:%SZ")},
-                        "temperature": {"N": str(temperature)},
-                        "device_status": {"S": "ok"}
-                    }
-
-                test_data.append(data_point)
-                current_timestamp += timedelta(seconds=1)
-                room_data_count += 1
-                total_generated += 1
-
-        print(f"    {room}: {room_data_count}件のデータを生成完了")
+
+    # 各部屋で指定数のデータポイント生成（1サイクルで部屋内の全センサーが1件ずつ出力）
+    cycles = DATA_POINTS_PER_ROOM // SENSORS_PER_ROOM
+    room_data_count = cycles * SENSORS_PER_ROOM
+
+    # 部屋ごとの生成は互いに独立しているため、部屋単位のタスクに分割する
+    # タイムスタンプは部屋の順番に連続するよう開始オフセットを割り当てる
+    seed = rng.randrange(2 ** 32)
+    room_tasks = [
+        (room,
+         room_sensor_mapping[room],
+         [device_error_patterns[sensor] for sensor in room_sensor_mapping[room]],
+         room_idx * room_data_count,
+         seed + room_idx)
+        for room_idx, room in enumerate(rooms)
+    ]
+
+    if NUM_WORKERS > 1:
+        print(f"  {NUM_WORKERS}プロセスで並列生成中...")
+        with ProcessPoolExecutor(max_workers=NUM_WORKERS) as executor:
+            room_chunks = list(executor.map(_generate_room, room_tasks))
+    else:
+        room_chunks = []
+        for room_idx, task in enumerate(room_tasks):
+            if verbose:
+                print(f"  部屋 {task[0]} ({room_idx + 1}/{len(rooms)}) のデータ生成中...")
+            room_chunks.append(_generate_room(task))
+
+    # 部屋ごとの列を連結して列指向のまま保持する
+    test_data = TelemetryColumns(device_ids=[], room_ids=[], timestamps=[], temperatures=[], statuses=[])
+    for room, chunk in zip(rooms, room_chunks):
+        test_data.device_ids.extend(chunk.device_ids)
+        test_data.room_ids.extend(chunk.room_ids)
+        test_data.timestamps.extend(chunk.timestamps)
+        test_data.temperatures.extend(chunk.temperatures)
+        test_data.statuses.extend(chunk.statuses)
+        if verbose:
+            print(f"    {room}: {len(chunk)}件のデータを生成完了")
+
+    total_generated = len(test_data)
 
     print(f"データ生成完了: 総計 {total_generated} 件")
 
     # 最終的なエラー率を確認
-    actual_error_count = sum(1 for item in test_data if item["device_status"]["S"] == "sensor_error")
+    actual_error_count = test_data.statuses.count("sensor_error")
     actual_error_rate = actual_error_count / len(test_data)
     print(f"全体エラー率確認: {actual_error_rate * 100:.2f}% ({actual_error_count}/{len(test_data)})")
 
     return test_data
 
 
-def save_test_data_to_file(data: List[Dict[str, Any]], filename: str = None):
-    """DynamoDB形式のテストデータをファイルに保存"""
-    if filename is None:
-        filename = OUTPUT_FILES["dynamodb_format"]
-
-    print(f"DynamoDB形式データを {filename} に保存中...")
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    print(f"DynamoDB形式テストデータを {filename} に保存しました。データ件数: {len(data)}")
-
-
-def save_normal_format_data(data: List[Dict[str, Any]], filename: str = None):
-    """通常のJSON形式でテストデータを保存"""
-    if filename is None:
-        filename = OUTPUT_FILES["normal_format"]
-
-    print(f"通常形式データを {filename} に保存中...")
-    normal_data = convert_dynamodb_to_normal_format(data)
-
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(normal_data, f, indent=2, ensure_ascii=False)
-    print(f"通常形式テストデータを {filename} に保存しました。データ件数: {len(normal_data)}")
-
-    return normal_data
-
+class JsonArrayStreamWriter:
+    """
+    JSON配列を1要素ずつエンコードしてファイルに書き出すライター
+    table_nameを指定した場合は {table_name: [...]} の形で出力する
+    整形出力時も全体をjson.dumps(indent=2)した場合と同じレイアウトになるよう、要素ごとにインデントを付与する
+    """
 
-def generate_batch_write_format(data: List[Dict[str, Any]], table_name: str = None) -> Dict[str, Any]:
-    """DynamoDB batch-write-item形式に変換"""
-    if table_name is None:
-        table_name = DYNAMODB_TABLE_NAME
+    def __init__(self, filename: str, pretty: bool, table_name: Optional[str] = None):
+        self.filename = filename
+        self.pretty = pretty
+        self.table_name = table_name
+        self.count = 0
+        self._file = None
+
+        if pretty:
+            indent = b'  ' if table_name is None else b'    '
+            self._item_prefix = indent
+            self._newline = b'\n' + indent
+            self._separator = b',\n'
+        else:
+            self._item_prefix = b''
+            self._newline = None
+            self._separator = b','
+
+    def __enter__(self) -> "JsonArrayStreamWriter":
+        self._file = open(self.filename, 'wb', buffering=WRITE_BUFFER_SIZE)
+        if self.table_name is None:
+            self._file.write(b'[\n' if self.pretty else b'[')
+        elif self.pretty:
+            self._file.write(b'{\n  ' + dumps_compact(self.table_name) + b': [\n')
+        else:
+            self._file.write(b'{' + dumps_compact(self.table_name) + b':[')
+        return self
+
+    def write(self, item: Any):
+        """配列要素を1件書き出し"""
+        if self.count:
+            self._file.write(self._separator)
+        if self.pretty:
+            self._file.write(self._item_prefix + dumps_json(item, True).replace(b'\n', self._newline))
+        else:
+            self._file.write(dumps_json(item, False))
+        self.count += 1
 
-    print(f"DynamoDB batch-write形式に変換中... (テーブル名: {table_name})")
-    batch_items = []
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.table_name is None:
+            self._file.write(b'\n]' if self.pretty else b']')
+        else:
+            self._file.write(b'\n  ]\n}' if self.pretty else b']}')
+        self._file.close()
+        return False
 
-    for item in data:
-        batch_item = {
-            "PutRequest": {
-                "Item": item
-            }
-        }
-        batch_items.append(batch_item)
 
-    print(f"batch-write形式変換完了: {len(batch_items)} アイテム")
-    return {table_name: batch_items}
+def save_output_files(data: TelemetryColumns, formats: Iterable[str], table_name: Optional[str] = None) -> Dict[str, int]:
+    """
+    指定された形式のファイルを1回の走査でまとめて保存
 
+    Args:
+        data: テストデータ
+        formats: 出力形式（OUTPUT_FILESのキー: dynamodb_format / normal_format / batch_write_format）
+        table_name: batch-write形式のテーブル名
 
-def save_batch_write_format(data: List[Dict[str, Any]], table_name: str = None, filename: str = None):
-    """DynamoDB batch-write形式でファイルに保存"""
+    Returns:
+        Dict[str, int]: 出力形式ごとの書き出し件数
+    """
     if table_name is None:
         table_name = DYNAMODB_TABLE_NAME
-    if filename is None:
-        filename = OUTPUT_FILES["batch_write_format"]
-
-    print(f"batch-write形式を {filename} に保存中... (テーブル名: {table_name})")
-    batch_format = generate_batch_write_format(data, table_name)
-
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(batch_format, f, indent=2, ensure_ascii=False)
-    print(f"DynamoDB batch-write形式を {filename} に保存しました。")
-
-
-def analyze_test_data(data: List[Dict[str, Any]]):
-    """テストデータの統計情報を表示"""
+    formats = set(formats)
+
+    with ExitStack() as stack:
+        dynamodb_writer = normal_writer = batch_writer = None
+
+        if "dynamodb_format" in formats:
+            print(f"DynamoDB形式データを {OUTPUT_FILES['dynamodb_format']} に保存中...")
+            dynamodb_writer = stack.enter_context(JsonArrayStreamWriter(
+                OUTPUT_FILES["dynamodb_format"], PRETTY_PRINT["dynamodb_format"]))
+        if "normal_format" in formats:
+            print(f"通常形式データを {OUTPUT_FILES['normal_format']} に保存中...")
+            normal_writer = stack.enter_context(JsonArrayStreamWriter(
+                OUTPUT_FILES["normal_format"], PRETTY_PRINT["normal_format"]))
+        if "batch_write_format" in formats:
+            print(f"batch-write形式を {OUTPUT_FILES['batch_write_format']} に保存中... (テーブル名: {table_name})")
+            batch_writer = stack.enter_context(JsonArrayStreamWriter(
+                OUTPUT_FILES["batch_write_format"], PRETTY_PRINT["batch_write_format"], table_name))
+
+        # 通常形式のみの場合はDynamoDB形式のアイテムを組み立てない
+        if dynamodb_writer is not None or batch_writer is not None:
+            normal_items = data.iter_normal_items() if normal_writer is not None else repeat(None)
+            for item, normal_item in zip(data.iter_dynamodb_items(), normal_items):
+                if dynamodb_writer is not None:
+                    dynamodb_writer.write(item)
+                if normal_writer is not None:
+                    normal_writer.write(normal_item)
+                if batch_writer is not None:
+                    batch_writer.write({"PutRequest": {"Item": item}})
+        elif normal_writer is not None:
+            for normal_item in data.iter_normal_items():
+                normal_writer.write(normal_item)
+
+    if dynamodb_writer is not None:
+        print(f"DynamoDB形式テストデータを {dynamodb_writer.filename} に保存しました。データ件数: {dynamodb_writer.count}")
+    if normal_writer is not None:
+        print(f"通常形式テストデータを {normal_writer.filename} に保存しました。データ件数: {normal_writer.count}")
+    if batch_writer is not None:
+        print(f"DynamoDB batch-write形式を {batch_writer.filename} に保存しました。")
+
+    written_counts = {}
+    for format_name, writer in (("dynamodb_format", dynamodb_writer),
+                                ("normal_format", normal_writer),
+                                ("batch_write_format", batch_writer)):
+        if writer is not None:
+            written_counts[format_name] = writer.count
+    return written_counts
+
+
+def analyze_test_data(data: TelemetryColumns):
+    """テストデータの統計情報を表示（全統計を1回の走査で集計）"""
     print("テストデータ分析中...")
     total_items = len(data)
 
-    # デバイス別統計
-    devices = set()
-    rooms = set()
-    error_count = 0
-    ok_count = 0
-
+    # 件数は列ごとにCounterで一括集計
     print("  基本統計を計算中...")
-    for item in data:
-        devices.add(item["device_id"]["S"])
-        rooms.add(item["room_id"]["S"])
-
-        if item["device_status"]["S"] == "sensor_error":
-            error_count += 1
-        else:
-            ok_count += 1
+    device_totals = Counter(data.device_ids)
+    room_totals = Counter(data.room_ids)
+    error_count = data.statuses.count("sensor_error")
+    ok_count = total_items - error_count
+
+    # エラー件数とセンサー配置は1回の走査でまとめて集計
+    print("  デバイス別・部屋別統計を計算中...")
+    device_errors = Counter()
+    room_errors = Counter()
+    device_to_room = {}
+    duplicated_rooms = defaultdict(set)  # 複数の部屋で検出されたセンサーのみ記録
+    for device, room, status in zip(data.device_ids, data.room_ids, data.statuses):
+        known_room = device_to_room.get(device)
+        if known_room is None:
+            device_to_room[device] = room
+        elif known_room != room:
+            duplicated_rooms[device].update((known_room, room))
+        if status == "sensor_error":
+            device_errors[device] += 1
+            room_errors[room] += 1
 
     print("=== テストデータ統計 ===")
     print(f"総データ件数: {total_items}")
-    print(f"ユニークデバイス数: {len(devices)}")
-    print(f"ユニーク部屋数: {len(rooms)}")
+    print(f"ユニークデバイス数: {len(device_totals)}")
+    print(f"ユニーク部屋数: {len(room_totals)}")
     print(f"正常データ: {ok_count} ({ok_count / total_items * 100:.2f}%)")
     print(f"エラーデータ: {error_count} ({error_count / total_items * 100:.2f}%)")
 
     # デバイス別エラー率統計
-    print("  デバイス別統計を計算中...")
-    device_stats = {}
-    for item in data:
-        device = item["device_id"]["S"]
-        if device not in device_stats:
-            device_stats[device] = {"total": 0, "error": 0}
-
-        device_stats[device]["total"] += 1
-        if item["device_status"]["S"] == "sensor_error":
-            device_stats[device]["error"] += 1
-
     print("\n=== デバイス別エラー率統計 ===")
     device_error_rates = []
-    for device, stats in sorted(device_stats.items()):
-        error_rate = stats["error"] / stats["total"] * 100
+    for device, total in sorted(device_totals.items()):
+        errors = device_errors[device]
+        error_rate = errors / total * 100
         device_error_rates.append(error_rate)
-        if len(device_stats) <= 20:  # デバイス数が少ない場合のみ詳細表示
-            print(f"{device}: {stats['total']}件, エラー率{error_rate:.1f}% ({stats['error']}/{stats['total']})")
+        if len(device_totals) <= 20:  # デバイス数が少ない場合のみ詳細表示
+            print(f"{device}: {total}件, エラー率{error_rate:.1f}% ({errors}/{total})")
 
     # デバイス別エラー率の統計
     if device_error_rates:
@@ -343,41 +544,23 @@ def analyze_test_data(data: List[Dict[str, Any]]):
         print(f"  - 最大: {max_error_rate:.2f}%")
         print(f"  - 期待値: {ERROR_RATE * 100:.2f}%")
 
-    # 部屋別統計
-    print("  部屋別統計を計算中...")
-    room_stats = {}
-    for item in data:
-        room = item["room_id"]["S"]
-        if room not in room_stats:
-            room_stats[room] = {"total": 0, "error": 0, "devices": set()}
-
-        room_stats[room]["total"] += 1
-        room_stats[room]["devices"].add(item["device_id"]["S"])
-
-        if item["device_status"]["S"] == "sensor_error":
-            room_stats[room]["error"] += 1
+    # 部屋別統計（部屋内デバイスはセンサー配置から逆引き）
+    room_devices = defaultdict(set)
+    for device, room in device_to_room.items():
+        room_devices[room].add(device)
+    for device, rooms_set in duplicated_rooms.items():
+        for room in rooms_set:
+            room_devices[room].add(device)
 
     print("\n=== 部屋別統計 ===")
-    for room, stats in sorted(room_stats.items()):
-        error_rate = stats["error"] / stats["total"] * 100
-        print(f"{room}: {stats['total']}件, {len(stats['devices'])}デバイス, エラー率{error_rate:.1f}%")
+    for room, total in sorted(room_totals.items()):
+        error_rate = room_errors[room] / total * 100
+        print(f"{room}: {total}件, {len(room_devices[room])}デバイス, エラー率{error_rate:.1f}%")
 
     # センサー重複チェック
     print("  センサー配置を検証中...")
-    device_room_mapping = {}
-    for item in data:
-        device = item["device_id"]["S"]
-        room = item["room_id"]["S"]
-
-        if device not in device_room_mapping:
-            device_room_mapping[device] = set()
-        device_room_mapping[device].add(room)
-
     # 重複センサーの確認
-    duplicated_sensors = []
-    for device, rooms_set in device_room_mapping.items():
-        if len(rooms_set) > 1:
-            duplicated_sensors.append((device, list(rooms_set)))
+    duplicated_sensors = [(device, sorted(rooms_set)) for device, rooms_set in duplicated_rooms.items()]
 
     print("\n=== センサー配置検証 ===")
     if duplicated_sensors:
@@ -390,8 +573,7 @@ def analyze_test_data(data: List[Dict[str, Any]]):
     # 部屋別センサー配置の表示（簡略版）
     print("\n=== 部屋別センサー配置 ===")
     room_device_mapping = {}
-    for device, rooms_set in device_room_mapping.items():
-        room = list(rooms_set)[0]  # 各センサーは1つの部屋にのみ属する
+    for device, room in device_to_room.items():  # 各センサーは最初に検出された部屋で表示
         if room not in room_device_mapping:
             room_device_mapping[room] = []
         room_device_mapping[room].append(device)
@@ -401,27 +583,32 @@ def analyze_test_data(data: List[Dict[str, Any]]):
         print(f"{room}: {len(sensors_in_room)}個のセンサー ({sensors_in_room[0]}~{sensors_in_room[-1]})")
 
 
-def compare_data_formats(dynamodb_data: List[Dict[str, Any]], normal_data: List[Dict[str, Any]]):
-    """DynamoDB形式と通常形式のデータを比較"""
+def compare_data_formats(dynamodb_data: TelemetryColumns, written_counts: Dict[str, int]):
+    """
+    DynamoDB形式と通常形式のデータを比較
+    件数は各ファイルへの書き出し件数で、内容は先頭のサンプルデータで確認する
+    """
     print("\n=== データ形式比較 ===")
 
-    if len(dynamodb_data) != len(normal_data):
-        print(f"WARNING: データ件数が異なります: DynamoDB={len(dynamodb_data)}, Normal={len(normal_data)}")
+    mismatched = {name: count for name, count in written_counts.items() if count != len(dynamodb_data)}
+    if mismatched:
+        print(f"WARNING: データ件数が異なります: 生成={len(dynamodb_data)}, 書き出し={written_counts}")
         return
 
     print(f"SUCCESS: データ件数一致: {len(dynamodb_data)} 件")
 
     # サンプルデータの比較
-    if dynamodb_data and normal_data:
+    if dynamodb_data:
+        sample_dynamo = next(dynamodb_data.iter_dynamodb_items())
+        sample_normal = next(dynamodb_data.iter_normal_items())
+
         print("\n--- サンプルデータ比較 ---")
         print("DynamoDB形式:")
-        print(json.dumps(dynamodb_data[0], indent=2, ensure_ascii=False))
+        print(json.dumps(sample_dynamo, indent=2, ensure_ascii=False))
         print("\n通常形式:")
-        print(json.dumps(normal_data[0], indent=2, ensure_ascii=False))
+        print(json.dumps(sample_normal, indent=2, ensure_ascii=False))
 
         # データ整合性チェック
-        sample_dynamo = dynamodb_data[0]
-        sample_normal = normal_data[0]
 
         integrity_check = True
 
@@ -472,13 +659,38 @@ def print_configuration():
     print(f"デバイスあたりデータポイント数: {DATA_POINTS_PER_ROOM // SENSORS_PER_ROOM}")
     print(f"総データポイント数: {NUM_ROOMS * DATA_POINTS_PER_ROOM}")
     print(f"エラー率: {ERROR_RATE * 100}% (各デバイス個別)")
+    print(f"並列プロセス数: {NUM_WORKERS}")
     print(f"開始時刻: {START_TIME}")
     print(f"出力ファイル:")
     for file_type, filename in OUTPUT_FILES.items():
         print(f"  - {file_type}: {filename}")
 
 
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    コマンドライン引数を解析
+    出力形式が1つも指定されていない場合は、DynamoDBへのインポートに必要なbatch-write形式のみ出力する
+    """
+    parser = argparse.ArgumentParser(description="IoTテレメトリーテストデータ生成")
+    parser.add_argument("--dynamodb", action="store_true",
+                        help=f"DynamoDB形式で出力 ({OUTPUT_FILES['dynamodb_format']})")
+    parser.add_argument("--normal", action="store_true",
+                        help=f"通常JSON形式で出力 ({OUTPUT_FILES['normal_format']})")
+    parser.add_argument("--batch", action="store_true",
+                        help=f"DynamoDB batch-write形式で出力 ({OUTPUT_FILES['batch_write_format']}) ※既定")
+    parser.add_argument("--verbose", action="store_true",
+                        help="部屋ごとの進捗を表示")
+    args = parser.parse_args(argv)
+
+    if not (args.dynamodb or args.normal or args.batch):
+        args.batch = True
+
+    return args
+
+
 if __name__ == "__main__":
+    args = parse_args()
+
     print("IoTテレメトリーテストデータ生成開始...")
     print("=" * 50)
 
@@ -488,7 +700,7 @@ if __name__ == "__main__":
 
     try:
         # テストデータ生成
-        test_data = generate_test_data()
+        test_data = generate_test_data(verbose=args.verbose)
         print(f"SUCCESS: テストデータ生成完了: {len(test_data)} 件")
 
         # 統計情報表示
@@ -499,28 +711,41 @@ if __name__ == "__main__":
         print("\n" + "=" * 50)
         print("ファイル保存開始...")
 
-        # DynamoDB形式で保存
-        save_test_data_to_file(test_data)
+        # 指定された形式のみ、1回の走査でまとめて保存
+        generated_files = []
+        formats = []
+
+        # DynamoDB形式
+        if args.dynamodb:
+            formats.append("dynamodb_format")
+            generated_files.append(f"{OUTPUT_FILES['dynamodb_format']} (DynamoDB形式)")
+
+        # 通常形式
+        if args.normal:
+            formats.append("normal_format")
+            generated_files.append(f"{OUTPUT_FILES['normal_format']} (通常JSON形式)")
 
-        # 通常形式で保存
-        normal_data = save_normal_format_data(test_data)
+        # batch-write形式
+        if args.batch:
+            formats.append("batch_write_format")
+            generated_files.append(f"{OUTPUT_FILES['batch_write_format']} (DynamoDB batch-write形式)")
 
-        # batch-write形式で保存
-        save_batch_write_format(test_data)
+        written_counts = save_output_files(test_data, formats)
 
-        # データ形式比較
-        compare_data_formats(test_data, normal_data)
+        # データ形式比較（通常形式と他の形式を併せて出力した場合のみ）
+        if args.normal and len(formats) > 1:
+            compare_data_formats(test_data, written_counts)
 
         print("\n" + "=" * 50)
         print("SUCCESS: テストデータ生成完了!")
         print("\n生成されたファイル:")
-        print(f"  - {OUTPUT_FILES['dynamodb_format']} (DynamoDB形式)")
-        print(f"  - {OUTPUT_FILES['normal_format']} (通常JSON形式)")
-        print(f"  - {OUTPUT_FILES['batch_write_format']} (DynamoDB batch-write形式)")
+        for generated_file in generated_files:
+            print(f"  - {generated_file}")
 
-        print(f"\nDynamoDBへのインポートコマンド:")
-        print(
-            f"./batch_write_request.sh")
+        if args.batch:
+            print(f"\nDynamoDBへのインポートコマンド:")
+            print(
+                f"./batch_write_request.sh")
 
     except Exception as e:
         print(f"ERROR: エラーが発生しました: {str(e)}")
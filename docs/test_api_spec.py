@@ -1,97 +1,540 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
 import json
+import re
+import threading
 import time
-from typing import Dict, List, Any, Optional
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Callable, Tuple
 from datetime import datetime
+from functools import lru_cache
+
+try:
+    import orjson  # 高速JSONデコーダ（未インストール時はrequests標準のデコードを使用）
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # ストリーミングJSONパーサ（未インストール時はレスポンス全体を読み込んで検証）
+except ImportError:
+    ijson = None
 
 
 class IoTAPISpecTester:
     """IoT テレメトリー API 仕様準拠テストクラス（バリデーションテスト含む）"""
 
-    def __init__(self, base_url: str):
+    # 独立したテストを並列実行する際の既定スレッド数
+    DEFAULT_WORKERS = 8
+
+    # エンドポイント別のレスポンス必須キー
+    ROOT_KEYS = frozenset(("data", "count"))
+    ROOT_PAGE_KEYS = frozenset(("data", "count", "next_page_token"))
+    DEVICES_LIST_KEYS = frozenset(("devices", "count"))
+    DEVICE_DETAIL_KEYS = frozenset(("device_id", "data", "count"))
+    DEVICE_ROOMS_KEYS = frozenset(("device_id", "rooms", "count"))
+    DEVICE_ROOM_DETAIL_KEYS = frozenset(("device_id", "room_id", "data", "count"))
+    ROOMS_LIST_KEYS = frozenset(("rooms", "count"))
+    ROOM_DETAIL_KEYS = frozenset(("room_id", "data", "count"))
+    ROOM_SUMMARY_KEYS = frozenset(("room_id", "count"))
+    ROOM_DEVICES_KEYS = frozenset(("room_id", "devices", "count"))
+    ROOM_DEVICE_DETAIL_KEYS = frozenset(("room_id", "device_id", "data", "count"))
+
+    # テストで使用する固定のエンドポイント（クラス定義時に1回だけ組み立てる）
+    TEST_DEVICE_ID = "sensor_01"
+    TEST_ROOM_ID = "room_001"
+    ENDPOINT_ROOT = "/"
+    ENDPOINT_DEVICES = "/devices"
+    ENDPOINT_SENSOR01 = f"/devices/{TEST_DEVICE_ID}"
+    ENDPOINT_SENSOR01_ROOMS = f"/devices/{TEST_DEVICE_ID}/rooms"
+    ENDPOINT_SENSOR01_ROOM001 = f"/devices/{TEST_DEVICE_ID}/{TEST_ROOM_ID}"
+    ENDPOINT_ROOMS = "/rooms"
+    ENDPOINT_ROOM001 = f"/rooms/{TEST_ROOM_ID}"
+    ENDPOINT_ROOM001_DEVICES = f"/rooms/{TEST_ROOM_ID}/devices"
+    ENDPOINT_ROOM001_SENSOR01 = f"/rooms/{TEST_ROOM_ID}/{TEST_DEVICE_ID}"
+
+    # ページング取得テストで使用する1ページあたりの件数
+    PAGING_LIMIT = 1000
+
+    # 属性指定テストで取得する属性（fieldsパラメータの値と、各データが持つべきキー）
+    ROOM_FIELDS = "timestamp,device_status"
+    ROOM_FIELDS_KEYS = frozenset(("timestamp", "device_status"))
+
+    # 時間範囲指定テストで使用する固定の時刻
+    TIME_RANGE_START = "2025-08-01T00:00:00Z"
+    TIME_RANGE_MIDPOINT = "2025-08-01T00:05:00Z"
+    TIME_RANGE_END = "2025-08-01T00:10:00Z"
+
+    # テレメトリーデータ1件あたりの必須キー
+    TELEMETRY_REQUIRED_KEYS = frozenset(("device_id", "room_id", "timestamp", "device_status"))
+
+    # エラーメッセージの期待値（比較用に事前にcasefold済み）
+    ERROR_VALIDATION_FAILED = "validation failed".casefold()
+    ERROR_QUERY_VALIDATION_FAILED = "query parameter validation failed".casefold()
+    ERROR_VALIDATION = "validation".casefold()
+    ERROR_INVALID = "invalid".casefold()
+    ERROR_MISSING_AUTH_TOKEN = "missing authentication token".casefold()
+
+    # 固定長のUTCタイムスタンプ形式（この形式同士であれば文字列の大小比較が時刻の前後と一致する）
+    CANONICAL_TIMESTAMP_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$")
+
+    # 部屋ID形式: room_number（numberは0より大きい3桁の数字、000は否定先読みで除外）
+    ROOM_ID_PATTERN = re.compile(r"room_(?!000)[0-9]{3}")
+
+    # バリデーションエラー系テストのケース表（クラス定義時に1回だけ作成し、各テストはこれを参照するだけにする）
+    # 6.2 デバイスIDバリデーションエラー: (不正なデバイスID, 説明)
+    INVALID_DEVICE_ID_CASES = (
+        ("sensor01", "アンダースコアなし"),
+        ("sensor_01_temp", "複数アンダースコア"),
+        ("sensor_00", "数値部分が0"),
+        ("sensor_-1", "負の数値"),
+        ("sensor_abc", "数値部分が文字列"),
+        ("_01", "空のデバイスタイプ")
+    )
+
+    # 6.3 部屋IDバリデーションエラー: (エンドポイント, 説明, 英語の説明)
+    INVALID_ROOM_ID_CASES = (
+        ("/rooms/%20", "スペースのみの部屋ID", "room_id with spaces only"),
+        # ("/rooms/_", "アンダースコアのみ", "room_id with underscore only"),
+        # ("/rooms/room01", "2桁の数値部分", "room_id with 2-digit number"),
+        # ("/rooms/room_0001", "4桁の数値部分", "room_id with 4-digit number"),
+        # ("/rooms/room_000", "数値部分が0", "room_id with zero number"),
+        # ("/rooms/room_-01", "負の数値", "room_id with negative number"),
+        # ("/rooms/room_abc", "数値部分が文字列", "room_id with non-numeric part"),
+        # ("/rooms/room__001", "複数のアンダースコア", "room_id with multiple underscores"),
+        # ("/rooms/room001", "アンダースコアなし", "room_id without underscore"),
+        # ("/rooms/office_001", "不正なプレフィックス", "room_id with wrong prefix"),
+        # ("/rooms/_001", "空のプレフィックス", "room_id with empty prefix"),
+        # ("/rooms/room_", "空の数値部分", "room_id with empty number part"),
+        # ("/rooms/room_01a", "数値部分に文字が混在", "room_id with mixed alphanumeric"),
+        # ("/rooms/room_1.0", "小数点を含む数値", "room_id with decimal number"),
+        # ("/rooms/ROOM_001", "大文字のプレフィックス", "room_id with uppercase prefix"),
+        # ("/rooms/room_+01", "正の符号付き数値", "room_id with positive sign"),
+        # ("/rooms/room_00a", "先頭0で文字が混在", "room_id with leading zero and letter")
+    )
+
+    # 6.4 タイムスタンプバリデーションエラー: (不正なタイムスタンプ, 説明)
+    INVALID_TIMESTAMP_CASES = (
+        ("2025-13-01T00:00:00Z", "不正な月"),
+        ("2025-08-01T25:00:00Z", "不正な時刻"),
+        ("2025/08/01 10:00:00", "ISO形式でない"),
+        ("2025-08-01T10:00:00", "タイムゾーン指定なし"),
+        ("invalid_timestamp", "完全に不正な文字列"),
+        ("2025-02-30T10:00:00Z", "存在しない日付")
+    )
+
+    # 6.5 ステータスバリデーションエラー: (不正なステータス, 説明)
+    INVALID_STATUS_CASES = (
+        ("broken", "存在しないステータス"),
+        ("OK", "大文字小文字混在"),
+        ("1", "数値ステータス"),
+        ("error", "部分的に正しいが無効"),
+        ("SENSOR_ERROR", "全て大文字")
+    )
+
+    # 6.6 複合バリデーションエラー: (デバイスID, クエリパラメータ, 説明)
+    COMPLEX_VALIDATION_ERROR_CASES = (
+        ("invalid_device", {"start_time": "invalid_time"}, "デバイスID + タイムスタンプエラー"),
+        ("bad_device", {"start_time": "bad_time", "end_time": "bad_end", "status": "bad_status"},
+         "全パラメータエラー")
+    )
+
+    # 6.7 存在しないエンドポイント: (パス, 説明)
+    NONEXISTENT_ROUTE_CASES = (
+        ("/nonexistent", "存在しないパス"),
+        ("/devices/sensor_01/room_001/invalid", "存在しないサブパス"),
+        ("/rooms/room_001/sensor_01/invalid", "存在しない部屋サブパス")
+    )
+
+    # 6.8 ページングパラメータバリデーションエラー: (クエリパラメータ, 説明)
+    INVALID_PAGINATION_CASES = (
+        ({"limit": "0"}, "limitが下限未満"),
+        ({"limit": "1001"}, "limitが上限超過"),
+        ({"limit": "abc"}, "limitが数値でない"),
+        # {"device_id": {"S": "sensor_01"}, "timestamp": {"N": "1754006400"}} をエンコードした改ざんトークン
+        ({"page_token": "eyJkZXZpY2VfaWQiOnsiUyI6InNlbnNvcl8wMSJ9LCJ0aW1lc3RhbXAiOnsiTiI6IjE3NTQwMDY0MDAifX0="},
+         "改ざんされたページトークン")
+    )
+
+    # 6.9 部屋データ取得オプションのバリデーションエラー: (クエリパラメータ, 説明)
+    INVALID_ROOM_QUERY_CASES = (
+        ({"fields": ""}, "空の属性指定"),
+        ({"fields": "timestamp,"}, "末尾に空の属性"),
+        ({"fields": "a,b"}, "存在しない属性"),
+        ({"summary": "yes"}, "true/false以外のサマリー指定")
+    )
+
+    def __init__(self, base_url: str, workers: int = DEFAULT_WORKERS):
         """
         Args:
             base_url: APIのベースURL (例: https://abc123.execute-api.us-east-1.amazonaws.com/prod)
+            workers: 独立したテストを並列実行する際のスレッド数（1の場合は逐次実行）
         """
         self.base_url = base_url.rstrip('/')
+        self.workers = max(1, workers)
         self.test_results = []
+        self._results_lock = threading.Lock()
+
+        # 全リクエストで1つのセッションを共有し、TCP/TLS接続を再利用する
+        # 接続プールは並列実行する全スレッドが接続を待たずに済む大きさにする
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=max(50, self.workers * 2),
+            max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504],
+                              raise_on_status=False)
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Accept": "application/json", "Accept-Encoding": "gzip"})
+
+        # 1回のテスト実行内のGETレスポンスキャッシュ（キー: エンドポイントとクエリパラメータ、成功時のみ保持）
+        # 値はFutureで、並列実行中に同じリクエストが重なった場合は最初の1件の完了を待って結果を共有する
+        self._response_cache: Dict[Tuple[str, Tuple], Future] = {}
+        self._cache_lock = threading.Lock()
+
+        # APIが固定長のUTC（末尾Z）形式でタイムスタンプを返すことを確認できた場合のみTrue
+        self.canonical_timestamps = False
 
         # テストデータから期待される値 - センサー数を200に変更
-        self.expected_devices = [f"sensor_{i:02d}" for i in range(1, 201)]  # sensor_01 ~ sensor_200
-        self.expected_rooms = [f"room_{i:03d}" for i in range(1, 11)]  # room_001 ~ room_010
+        # 実行中に変更しない値のためタプルで保持する
+        self.expected_devices = tuple(f"sensor_{i:02d}" for i in range(1, 201))  # sensor_01 ~ sensor_200
+        self.expected_rooms = tuple(f"room_{i:03d}" for i in range(1, 11))  # room_001 ~ room_010
         self.total_expected_items = 10000
         self.items_per_room = 1000
         self.devices_per_room = 20
 
-    def make_request(self, endpoint: str, params: Optional[Dict] = None, expect_error: bool = False) -> Dict[str, Any]:
-        """APIリクエストを実行"""
+    @staticmethod
+    def _decode_json(response: requests.Response) -> Any:
+        """レスポンスボディをJSONとしてデコード（空ボディの場合は空の辞書）"""
+        if not response.content:
+            return {}
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+
+    def make_request(self, endpoint: str, params: Optional[Dict] = None, expect_error: bool = False,
+                     use_cache: bool = True) -> Dict[str, Any]:
+        """
+        APIリクエストを実行
+        GETは冪等なため、同じエンドポイント・パラメータへの成功したレスポンスは1回のテスト実行内で再利用する
+        （エラーを期待するリクエストとuse_cache=Falseの場合は毎回送信する）
+        """
+        if expect_error or not use_cache:
+            return self._send_request(endpoint, params, expect_error)
+
+        key = (endpoint, tuple(sorted(params.items())) if params else ())
+        with self._cache_lock:
+            future = self._response_cache.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._response_cache[key] = Future()
+
+        if is_owner:
+            try:
+                result = self._send_request(endpoint, params, expect_error)
+            except BaseException as e:
+                with self._cache_lock:
+                    del self._response_cache[key]
+                future.set_exception(e)
+                raise
+            if not result["success"]:
+                # 失敗したレスポンスはキャッシュせず、次回は再送信する
+                with self._cache_lock:
+                    del self._response_cache[key]
+            future.set_result(result)
+
+        # 呼び出し側での変更がキャッシュに影響しないよう、結果の辞書はコピーして返す
+        result = dict(future.result())
+        if not is_owner:
+            # キャッシュから返した結果は今回計測していないため、最初のリクエストのレスポンス時間は引き継がない
+            result["cached"] = True
+            result["response_time"] = None
+        return result
+
+    def _send_request(self, endpoint: str, params: Optional[Dict], expect_error: bool) -> Dict[str, Any]:
+        """APIリクエストを送信して結果を辞書にまとめる"""
         url = f"{self.base_url}{endpoint}"
 
         try:
-            response = requests.get(url, params=params, timeout=30)
+            # レスポンス時間はtimedeltaを生成するresponse.elapsedではなくperf_counterの差分で計測する
+            request_start = time.perf_counter()
+            response = self.session.get(url, params=params, timeout=30)
+            response_time = time.perf_counter() - request_start
 
             # エラーが期待される場合は、ステータスコードに関係なく成功とする
             if expect_error:
                 return {
                     "success": True,
                     "status_code": response.status_code,
-                    "data": response.json() if response.content else {},
-                    "response_time": response.elapsed.total_seconds()
+                    "data": self._decode_json(response),
+                    "response_time": response_time
                 }
 
             response.raise_for_status()
             return {
                 "success": True,
                 "status_code": response.status_code,
-                "data": response.json(),
-                "response_time": response.elapsed.total_seconds()
+                "data": self._decode_json(response),
+                "response_time": response_time
             }
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
+            # JSONデコードエラー（orjson.JSONDecodeErrorはValueErrorのサブクラス）も失敗として扱う
+            error_response = getattr(e, 'response', None)
+            return {
+                "success": False,
+                "error": str(e),
+                "status_code": getattr(error_response, 'status_code', None),
+                "response_data": self._decode_error_body(error_response)
+            }
+
+    @classmethod
+    def _decode_error_body(cls, response: Optional[requests.Response]) -> Any:
+        """エラーレスポンスのボディをデコード（レスポンスがない場合やJSONでない場合は空の辞書）"""
+        if response is None:
+            return {}
+        try:
+            return cls._decode_json(response)
+        except ValueError:
+            return {}
+
+    def stream_telemetry_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        テレメトリーデータ配列を返すエンドポイントをストリーミングで取得・検証（ijsonが必要）
+        レスポンス全体をメモリに展開せず、dataの要素を1件ずつ組み立てて構造を検証する
+
+        Returns:
+            Dict[str, Any]: keys（トップレベルのキー）, count, item_count（data配列の要素数）,
+                            valid_structure（全要素の構造が正しいか）を含む結果
+        """
+        url = f"{self.base_url}{endpoint}"
+
+        try:
+            request_start = time.perf_counter()
+            with self.session.get(url, params=params, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                # gzip圧縮されたレスポンスも展開しながら読み込む
+                response.raw.decode_content = True
+
+                top_level_keys = set()
+                count = None
+                item_count = 0
+                valid_structure = True
+                builder = None
+
+                for prefix, event, value in ijson.parse(response.raw, use_float=True):
+                    if builder is not None:
+                        builder.event(event, value)
+                        if prefix == "data.item" and event == "end_map":
+                            item_count += 1
+                            if valid_structure and not self.validate_telemetry_data_structure((builder.value,)):
+                                valid_structure = False
+                            builder = None
+                    elif prefix == "data.item" and event == "start_map":
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                    elif prefix == "" and event == "map_key":
+                        top_level_keys.add(value)
+                    elif prefix == "count" and event == "number":
+                        count = value
+
+                # _send_requestと同じく、ボディを最後まで読み終えた時点までをレスポンス時間とする
+                response_time = time.perf_counter() - request_start
+
+                return {
+                    "success": True,
+                    "status_code": response.status_code,
+                    "keys": frozenset(top_level_keys),
+                    "count": count,
+                    "item_count": item_count,
+                    "valid_structure": valid_structure,
+                    "response_time": response_time
+                }
+        # response.rawを直接読むため、ボディ読み込み中の切断などはrequestsで包まれずurllib3の例外として送出される
+        except (requests.exceptions.RequestException, Urllib3HTTPError, ijson.JSONError) as e:
             return {
                 "success": False,
                 "error": str(e),
-                "status_code": getattr(e.response, 'status_code', None) if hasattr(e, 'response') else None,
-                "response_data": getattr(e.response, 'json', lambda: {})() if hasattr(e,
-                                                                                      'response') and e.response else {}
+                "status_code": getattr(e.response, 'status_code', None) if hasattr(e, 'response') else None
             }
 
-    def validate_response_structure(self, data: Dict, expected_keys: List[str]) -> bool:
-        """レスポンス構造の検証"""
-        return all(key in data for key in expected_keys)
+    def _get_device_total(self, device_id: str) -> Dict[str, Any]:
+        """デバイスの全データ（条件指定なし）を取得（キャッシュあり）"""
+        return self.make_request(f"/devices/{device_id}")
+
+    def _get_device_rooms(self, device_id: str) -> Dict[str, Any]:
+        """デバイスの配置部屋一覧を取得（キャッシュあり）"""
+        return self.make_request(f"/devices/{device_id}/rooms")
+
+    def setup_fixtures(self):
+        """
+        複数のテストで共有するレスポンスをテスト開始前に取得
+        sensor_01の配置部屋一覧は3.3.1・3.5.2で、全データは3.3.2・3.3.5で参照するため、1回だけ取得してキャッシュしておく
+        （3.3.1と3.4は自身の計測対象のリクエストをキャッシュを使わずに送信する）
+        """
+        print(f"Preparing fixtures: GET {self.ENDPOINT_SENSOR01_ROOMS}")
+        self.fixture_sensor01_rooms = self._get_device_rooms(self.TEST_DEVICE_ID)
+        if not self.fixture_sensor01_rooms["success"]:
+            print(f"  Failed to prepare fixture: {self.fixture_sensor01_rooms['error']}")
+
+        # タイムスタンプが固定長のUTC形式で返されることを確認（時間範囲チェックを文字列比較で行う前提）
+        print(f"Preparing fixtures: GET {self.ENDPOINT_SENSOR01}")
+        device_total = self._get_device_total(self.TEST_DEVICE_ID)
+        if device_total["success"]:
+            match_canonical = self.CANONICAL_TIMESTAMP_PATTERN.match
+            self.canonical_timestamps = all(
+                match_canonical(item.get("timestamp", "")) for item in device_total["data"].get("data", []))
+            if not self.canonical_timestamps:
+                print("  Timestamps are not in YYYY-MM-DDTHH:MM:SSZ format; falling back to datetime comparison")
+        else:
+            print(f"  Failed to prepare fixture: {device_total['error']}")
+
+    def close(self):
+        """HTTPセッションを閉じて接続を解放"""
+        self.session.close()
+
+    def __enter__(self) -> "IoTAPISpecTester":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _record_result(self, test_result: Dict[str, Any]):
+        """テスト結果を記録（並列実行中のスレッドから呼ばれるためロック内で追加）"""
+        with self._results_lock:
+            self.test_results.append(test_result)
+
+    def run_tests_concurrently(self, test_methods: List[Callable[[], Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        互いに依存しないテストメソッドをスレッドプールで並列実行
+        HTTPリクエストの待ち時間を重ねて短縮する（requestsはソケット待ちの間GILを解放する）
+
+        各テストメソッドは1件のテスト結果を返し、self.test_resultsに1件だけ追加するものに限る
+        結果は完了順ではなく、渡したメソッドの順番でself.test_resultsに並べ直す
+        """
+        if self.workers == 1 or len(test_methods) <= 1:
+            return [test_method() for test_method in test_methods]
+
+        with self._results_lock:
+            start_index = len(self.test_results)
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(test_methods))) as executor:
+            futures = [executor.submit(test_method) for test_method in test_methods]
+            results = [future.result() for future in futures]
+
+        with self._results_lock:
+            self.test_results[start_index:] = results
+        return results
+
+    def make_requests_concurrently(self, requests_to_send: List[Tuple[str, Optional[Dict]]],
+                                   expect_error: bool = False) -> List[Dict[str, Any]]:
+        """
+        互いに独立した複数のGETリクエストをスレッドプールで並列に送信
+        requests_to_sendは(エンドポイント, クエリパラメータ)のリスト
+        結果は完了順ではなく、渡したリクエストの順番で返す
+        """
+        def send(request: Tuple[str, Optional[Dict]]) -> Dict[str, Any]:
+            endpoint, params = request
+            return self.make_request(endpoint, params, expect_error=expect_error)
+
+        if self.workers == 1 or len(requests_to_send) <= 1:
+            return [send(request) for request in requests_to_send]
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(requests_to_send))) as executor:
+            return list(executor.map(send, requests_to_send))
+
+    def missing_response_keys(self, data: Dict, expected_keys: frozenset) -> List[str]:
+        """レスポンス構造の検証（不足している必須キーを返す。全て含まれていれば空リスト）"""
+        return sorted(expected_keys - data.keys())
+
+    def response_structure_errors(self, data: Dict, expected_keys: frozenset) -> List[str]:
+        """レスポンス構造の検証結果をエラーメッセージのリストで返す（問題がなければ空リスト）"""
+        if expected_keys <= data.keys():
+            return []
+        return [f"Missing required keys: {', '.join(self.missing_response_keys(data, expected_keys))}"]
 
     def validate_telemetry_data_structure(self, items: List[Dict]) -> bool:
-        """テレメトリーデータ構造の検証"""
-        required_keys = ["device_id", "room_id", "timestamp", "device_status"]
+        """
+        テレメトリーデータ構造の検証
+        全件（/ では10000件）を走査するため、ループ内で参照する名前はローカル変数に束縛し、
+        不正なデータが見つかった時点で終了する
+        """
+        required_keys = self.TELEMETRY_REQUIRED_KEYS
+        number_types = (int, float)
 
         for item in items:
-            if not all(key in item for key in required_keys):
+            if not required_keys <= item.keys():
                 return False
 
-            # temperatureはnullまたは数値
-            if "temperature" in item:
-                temp = item["temperature"]
-                if temp is not None and not isinstance(temp, (int, float)):
-                    return False
+            # temperatureはnullまたは数値（キーが存在しない場合もnullとして扱う）
+            # JSONの数値はint/floatそのものなので、isinstanceではなく型の一致で判定する（boolは不正として扱う）
+            temp = item.get("temperature")
+            if temp is not None and type(temp) not in number_types:
+                return False
 
         return True
 
-    def validate_error_response(self, data: Dict, expected_status: int, expected_error_message: str = None) -> List[
-        str]:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_timestamp(timestamp: str) -> datetime:
+        """
+        ISO8601形式（末尾Z）のタイムスタンプをdatetimeに変換
+        テレメトリーデータは全デバイスで同じ時刻が繰り返し現れるため、変換結果をキャッシュする
+        """
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+    def _find_out_of_range(self, items: List[Dict], start_time: Optional[str] = None,
+                           end_time: Optional[str] = None) -> int:
+        """
+        時間範囲外のデータを検索
+        範囲の境界は1回だけ変換し、最初に範囲外のデータが見つかった時点で終了する
+
+        Args:
+            items: テレメトリーデータのリスト
+            start_time: 開始時刻（省略時は下限なし）
+            end_time: 終了時刻（省略時は上限なし）
+
+        Returns:
+            int: 最初に範囲外となったデータのインデックス（全て範囲内の場合は-1）
+        """
+        match_canonical = self.CANONICAL_TIMESTAMP_PATTERN.match
+        if self.canonical_timestamps and all(match_canonical(bound) for bound in (start_time, end_time) if bound):
+            # 固定長UTC形式同士のため、datetimeに変換せず文字列のまま比較する
+            for index, item in enumerate(items):
+                timestamp = item["timestamp"]
+                if (start_time and timestamp < start_time) or (end_time and timestamp > end_time):
+                    return index
+            return -1
+
+        start = self._parse_timestamp(start_time) if start_time else None
+        end = self._parse_timestamp(end_time) if end_time else None
+        parse = self._parse_timestamp
+
+        for index, item in enumerate(items):
+            item_time = parse(item["timestamp"])
+            if (start is not None and item_time < start) or (end is not None and item_time > end):
+                return index
+
+        return -1
+
+    def validate_error_response(self, data: Dict, expected_status: int,
+                                expected_error_message_folded: Optional[str] = None) -> List[str]:
         """
         エラーレスポンスの検証 - 大文字小文字を無視して比較
+
+        Args:
+            expected_error_message_folded: 期待するエラーメッセージ（casefold済みの文字列を渡すこと）
         """
         errors = []
 
         # エラーキーの存在チェック
         if "error" not in data:
             errors.append("Missing 'error' key in error response")
-        elif expected_error_message:
-            # 大文字小文字を無視してエラーメッセージを比較
-            actual_error = data["error"].lower()
-            expected_error = expected_error_message.lower()
-
-            if expected_error not in actual_error:
-                errors.append(f"Expected error message containing '{expected_error_message}', got '{data['error']}'")
+        elif expected_error_message_folded and expected_error_message_folded not in data["error"].casefold():
+            errors.append(
+                f"Expected error message containing '{expected_error_message_folded}', got '{data['error']}'")
 
         return errors
 
@@ -101,7 +544,11 @@ class IoTAPISpecTester:
     def test_root_endpoint(self) -> Dict[str, Any]:
         """3.1 全データ取得のテスト"""
         print("Testing 3.1: GET /")
-        result = self.make_request("/")
+        # 全データ（10000件）を返すため、ijsonが利用可能な場合はストリーミングで検証する
+        if ijson is not None:
+            result = self.stream_telemetry_request(self.ENDPOINT_ROOT)
+        else:
+            result = self.make_request(self.ENDPOINT_ROOT)
 
         test_result = {
             "test_id": "3.1",
@@ -114,30 +561,127 @@ class IoTAPISpecTester:
 
         if not result["success"]:
             test_result["errors"].append(f"Request failed: {result['error']}")
-            self.test_results.append(test_result)
+            self._record_result(test_result)
             return test_result
 
-        data = result["data"]
+        if ijson is not None:
+            response_keys = result["keys"]
+            actual_count = result["count"] if result["count"] is not None else 0
+            item_count = result["item_count"]
+            valid_structure = result["valid_structure"]
+        else:
+            data = result["data"]
+            response_keys = data.keys()
+            actual_count = data.get("count", 0)
+            item_count = len(data.get("data", []))
+            valid_structure = self.validate_telemetry_data_structure(data.get("data", []))
 
-        # レスポンス構造チェック
-        if not self.validate_response_structure(data, ["data", "count"]):
-            test_result["errors"].append("Missing required keys: data, count")
+        # レスポンス構造チェック（ストリーミング時のキー集合とdict.keys()のどちらも集合演算で比較できる）
+        missing_keys = self.ROOT_KEYS - response_keys
+        if missing_keys:
+            test_result["errors"].append(f"Missing required keys: {', '.join(sorted(missing_keys))}")
 
         # データ件数チェック
-        actual_count = data.get("count", 0)
         if actual_count != self.total_expected_items:
             test_result["errors"].append(f"Expected {self.total_expected_items} items, got {actual_count}")
 
+        # countフィールドと実際のdata配列の要素数の一致チェック
+        if item_count != actual_count:
+            test_result["errors"].append(f"Count field ({actual_count}) does not match data items ({item_count})")
+
         # データ構造チェック
-        items = data.get("data", [])
-        if not self.validate_telemetry_data_structure(items):
+        if not valid_structure:
             test_result["errors"].append("Invalid telemetry data structure")
 
         test_result["success"] = len(test_result["errors"]) == 0
         test_result["response_time"] = result["response_time"]
         test_result["actual_count"] = actual_count
 
-        self.test_results.append(test_result)
+        self._record_result(test_result)
+        return test_result
+
+    # ============================================================================
+    # テストケース：全データ取得（ページング）
+    # ============================================================================
+    def test_root_endpoint_paging(self) -> Dict[str, Any]:
+        """3.1.1 全データ取得のテスト（limit/page_tokenによるページング）"""
+        print(f"Testing 3.1.1: GET / with limit={self.PAGING_LIMIT}")
+
+        test_result = {
+            "test_id": "3.1.1",
+            "endpoint": "GET /",
+            "description": "全データ取得（ページング）",
+            "test_type": "positive",
+            "success": False,
+            "errors": [],
+            "params": {"limit": self.PAGING_LIMIT}
+        }
+
+        # ページングなしの件数を基準にする
+        unpaged = self.make_request(self.ENDPOINT_ROOT)
+        if not unpaged["success"]:
+            test_result["errors"].append(f"Request failed: {unpaged['error']}")
+            self._record_result(test_result)
+            return test_result
+        expected_count = unpaged["data"].get("count", 0)
+
+        # next_page_tokenがnullになるまで辿る（応答が不正な場合に終わらないよう、想定ページ数+1で打ち切る）
+        max_pages = expected_count // self.PAGING_LIMIT + 1
+        params = {"limit": self.PAGING_LIMIT}
+        keys = set()
+        total_count = 0
+        pages = 0
+        response_time = 0.0
+
+        while True:
+            result = self.make_request(self.ENDPOINT_ROOT, params, use_cache=False)
+            if not result["success"]:
+                test_result["errors"].append(f"Request failed on page {pages + 1}: {result['error']}")
+                break
+
+            data = result["data"]
+            pages += 1
+            response_time += result["response_time"]
+
+            page_errors = self.response_structure_errors(data, self.ROOT_PAGE_KEYS)
+            if page_errors:
+                test_result["errors"].extend(f"Page {pages}: {error}" for error in page_errors)
+                break
+
+            items = data["data"]
+            if data["count"] != len(items):
+                test_result["errors"].append(
+                    f"Page {pages}: count field ({data['count']}) does not match data items ({len(items)})")
+            if len(items) > self.PAGING_LIMIT:
+                test_result["errors"].append(f"Page {pages}: {len(items)} items exceed limit {self.PAGING_LIMIT}")
+            if not self.validate_telemetry_data_structure(items):
+                test_result["errors"].append(f"Page {pages}: Invalid telemetry data structure")
+                break
+
+            total_count += len(items)
+            keys.update((item["device_id"], item["timestamp"]) for item in items)
+
+            next_page_token = data["next_page_token"]
+            if next_page_token is None:
+                break
+            if pages >= max_pages:
+                test_result["errors"].append(f"next_page_token still returned after {pages} pages")
+                break
+            params = {"limit": self.PAGING_LIMIT, "page_token": next_page_token}
+
+        if not test_result["errors"]:
+            # 全ページの合計件数がページングなしの件数と一致し、ページ間で重複がないこと
+            if total_count != expected_count:
+                test_result["errors"].append(f"Paged total ({total_count}) does not match unpaged count ({expected_count})")
+            if len(keys) != total_count:
+                test_result["errors"].append(f"Duplicate items across pages: {total_count - len(keys)}")
+
+        test_result["success"] = len(test_result["errors"]) == 0
+        test_result["response_time"] = response_time
+        test_result["pages"] = pages
+        test_result["actual_count"] = total_count
+
+        self._record_result(test_result)
         return test_result
 
     # ============================================================================
@@ -146,7 +690,7 @@ class IoTAPISpecTester:
     def test_devices_list(self) -> Dict[str, Any]:
         """3.2 デバイス一覧取得のテスト"""
         print("Testing 3.2: GET /devices")
-        result = self.make_request("/devices")
+        result = self.make_request(self.ENDPOINT_DEVICES)
 
         test_result = {
             "test_id": "3.2",
@@ -159,14 +703,13 @@ class IoTAPISpecTester:
 
         if not result["success"]:
             test_result["errors"].append(f"Request failed: {result['error']}")
-            self.test_results.append(test_result)
+            self._record_result(test_result)
             return test_result
 
         data = result["data"]
 
         # レスポンス構造チェック
-        if not self.validate_response_structure(data, ["devices", "count"]):
-            test_result["errors"].append("Missing required keys: devices, count")
+        test_result["errors"].extend(self.response_structure_errors(data, self.DEVICES_LIST_KEYS))
 
         # デバイス数チェック
         devices = data.get("devices", [])
@@ -177,14 +720,15 @@ class IoTAPISpecTester:
             test_result["errors"].append(f"Expected {expected_count} devices, got {actual_count}")
 
         # countフィールドの整合性チェック
-        if data.get("count") != actual_count:
-            test_result["errors"].append(f"Count field mismatch: count={data.get('count')}, actual={actual_count}")
+        response_count = data.get("count")
+        if response_count != actual_count:
+            test_result["errors"].append(f"Count field mismatch: count={response_count}, actual={actual_count}")
 
         test_result["success"] = len(test_result["errors"]) == 0
         test_result["response_time"] = result["response_time"]
         test_result["actual_count"] = actual_count
 
-        self.test_results.append(test_result)
+        self._record_result(test_result)
         return test_result
 
     # ============================================================================
@@ -194,7 +738,8 @@ class IoTAPISpecTester:
         """3.3.1 特定デバイスのテレメトリーデータ取得（基本）"""
         device_id = "sensor_01"
         print(f"Testing 3.3.1: GET /devices/{device_id}")
-        result = self.make_request(f"/devices/{device_id}")
+        # レスポンス時間を計測するため、フィクスチャのキャッシュを使わずに送信する
+        result = self.make_request(self.ENDPOINT_SENSOR01, use_cache=False)
 
         test_result = {
             "test_id": "3.3.1",
@@ -207,7 +752,7 @@ class IoTAPISpecTester:
 
         if not result["success"]:
             test_result["errors"].append(f"Request failed: {result['error']}")
-            self.test_results.append(test_result)
+            self._record_result(test_result)
             return test_result
 
         data = result["data"]
@@ -215,12 +760,12 @@ class IoTAPISpecTester:
         # ステータスコード 200 チェック（既に result["success"] で確認済み）
 
         # レスポンス構造チェック (device_id, data, count)
-        if not self.validate_response_structure(data, ["device_id", "data", "count"]):
-            test_result["errors"].append("Missing required keys: device_id, data, count")
+        test_result["errors"].extend(self.response_structure_errors(data, self.DEVICE_DETAIL_KEYS))
 
         # device_id チェック
-        if data.get("device_id") != device_id:
-            test_result["errors"].append(f"Expected device_id {device_id}, got {data.get('device_id')}")
+        response_device_id = data.get("device_id")
+        if response_device_id != device_id:
+            test_result["errors"].append(f"Expected device_id {device_id}, got {response_device_id}")
 
         # データ構造チェック
         items = data.get("data", [])
@@ -228,13 +773,12 @@ class IoTAPISpecTester:
             test_result["errors"].append("Invalid telemetry data structure")
 
         # データ整合性チェック（全てのデータが指定デバイスのものか）
-        for item in items:
-            if item.get("device_id") != device_id:
-                test_result["errors"].append(f"Found data for different device: {item.get('device_id')}")
-                break
+        bad_item = next((item for item in items if item.get("device_id") != device_id), None)
+        if bad_item is not None:
+            test_result["errors"].append(f"Found data for different device: {bad_item.get('device_id')}")
 
         # 単一部屋配置チェック
-        room_result = self.make_request(f"/devices/{device_id}/rooms")
+        room_result = self._get_device_rooms(device_id)
         if room_result["success"]:
             room_data = room_result["data"]
             rooms = room_data.get("rooms", [])
@@ -251,7 +795,7 @@ class IoTAPISpecTester:
         test_result["response_time"] = result["response_time"]
         test_result["actual_count"] = data.get("count", 0)
 
-        self.test_results.append(test_result)
+        self._record_result(test_result)
         return test_result
 
     # ============================================================================
@@ -261,12 +805,12 @@ class IoTAPISpecTester:
         """3.3.2 特定デバイスのテレメトリーデータ取得（時間範囲指定）"""
         device_id = "sensor_01"
         params = {
-            "start_time": "2025-08-01T00:00:00Z",
-            "end_time": "2025-08-01T00:10:00Z"
+            "start_time": self.TIME_RANGE_START,
+            "end_time": self.TIME_RANGE_END
         }
 
         print(f"Testing 3.3.2: GET /devices/{device_id} with time range")
-        result = self.make_request(f"/devices/{device_id}", params)
+        result = self.make_request(self.ENDPOINT_SENSOR01, params)
 
         test_result = {
             "test_id": "3.3.2",
@@ -281,31 +825,25 @@ class IoTAPISpecTester:
         # ステータスコード 200 チェック
         if not result["success"]:
             test_result["errors"].append(f"Request failed: {result['error']}")
-            self.test_results.append(test_result)
+            self._record_result(test_result)
             return test_result
 
         data = result["data"]
 
         # 基本構造チェック
-        if not self.validate_response_structure(data, ["device_id", "data", "count"]):
-            test_result["errors"].append("Missing required keys: device_id, data, count")
+        test_result["errors"].extend(self.response_structure_errors(data, self.DEVICE_DETAIL_KEYS))
 
         # 時間範囲内データチェック
         items = data.get("data", [])
-        start_time = datetime.fromisoformat(params["start_time"].replace('Z', '+00:00'))
-        end_time = datetime.fromisoformat(params["end_time"].replace('Z', '+00:00'))
-
-        for item in items:
-            item_time = datetime.fromisoformat(item["timestamp"].replace('Z', '+00:00'))
-            if not (start_time <= item_time <= end_time):
-                test_result["errors"].append(f"Data outside time range: {item['timestamp']}")
-                break
+        out_of_range = self._find_out_of_range(items, params["start_time"], params["end_time"])
+        if out_of_range >= 0:
+            test_result["errors"].append(f"Data outside time range: {items[out_of_range]['timestamp']}")
 
         # データ件数チェック（≤ 全データ件数）
         total_sensors = len(self.expected_devices)
         expected_data_points_per_sensor = self.total_expected_items // total_sensors
 
-        total_data_result = self.make_request(f"/devices/{device_id}")
+        total_data_result = self._get_device_total(device_id)
         if total_data_result["success"]:
             total_count = total_data_result["data"].get("count", 0)
             filtered_count = data.get("count", 0)
@@ -338,7 +876,7 @@ class IoTAPISpecTester:
         test_result["response_time"] = result["response_time"]
         test_result["actual_count"] = data.get("count", 0)
 
-        self.test_results.append(test_result)
+        self._record_result(test_result)
         return test_result
 
     # ============================================================================
@@ -347,10 +885,10 @@ class IoTAPISpecTester:
     def test_device_detail_start_time_only(self) -> Dict[str, Any]:
         """3.3.3 特定デバイスのテレメトリーデータ取得（開始時刻のみ指定）"""
         device_id = "sensor_01"
-        params = {"start_time": "2025-08-01T00:05:00Z"}
+        params = {"start_time": self.TIME_RANGE_MIDPOINT}
 
         print(f"Testing 3.3.3: GET /devices/{device_id} with start_time only")
-        result = self.make_request(f"/devices/{device_id}", params)
+        result = self.make_request(self.ENDPOINT_SENSOR01, params)
 
         test_result = {
             "test_id": "3.3.3",
@@ -364,30 +902,25 @@ class IoTAPISpecTester:
 
         if not result["success"]:
             test_result["errors"].append(f"Request failed: {result['error']}")
-            self.test_results.append(test_result)
+            self._record_result(test_result)
             return test_result
 
         data = result["data"]
 
         # 基本構造チェック
-        if not self.validate_response_structure(data, ["device_id", "data", "count"]):
-            test_result["errors"].append("Missing required keys: device_id, data, count")
+        test_result["errors"].extend(self.response_structure_errors(data, self.DEVICE_DETAIL_KEYS))
 
         # 開始時刻以降のデータかチェック
         items = data.get("data", [])
-        start_time = datetime.fromisoformat(params["start_time"].replace('Z', '+00:00'))
-
-        for item in items:
-            item_time = datetime.fromisoformat(item["timestamp"].replace('Z', '+00:00'))
-            if item_time < start_time:
-                test_result["errors"].append(f"Data before start_time: {item['timestamp']}")
-                break
+        out_of_range = self._find_out_of_range(items, start_time=params["start_time"])
+        if out_of_range >= 0:
+            test_result["errors"].append(f"Data before start_time: {items[out_of_range]['timestamp']}")
 
         test_result["success"] = len(test_result["errors"]) == 0
         test_result["response_time"] = result["response_time"]
         test_result["actual_count"] = data.get("count", 0)
 
-        self.test_results.append(test_result)
+        self._record_result(test_result)
         return test_result
 
     # ============================================================================
@@ -396,10 +929,10 @@ class IoTAPISpecTester:
     def test_device_detail_end_time_only(self) -> Dict[str, Any]:
         """3.3.4 特定デバイスのテレメトリーデータ取得（終了時刻のみ指定）"""
         device_id = "sensor_01"
-        params = {"end_time": "2025-08-01T00:05:00Z"}
+        params = {"end_time": self.TIME_RANGE_MIDPOINT}
 
         print(f"Testing 3.3.4: GET /devices/{device_id} with end_time only")
-        result = self.make_request(f"/devices/{device_id}", params)
+        result = self.make_request(self.ENDPOINT_SENSOR01, params)
 
         test_result = {
             "test_id": "3.3.4",
@@ -413,30 +946,25 @@ class IoTAPISpecTester:
 
         if not result["success"]:
             test_result["errors"].append(f"Request failed: {result['error']}")
-            self.test_results.append(test_result)
+            self._record_result(test_result)
             return test_result
 
         data = result["data"]
 
         # 基本構造チェック
-        if not self.validate_response_structure(data, ["device_id", "data", "count"]):
-            test_result["errors"].append("Missing required keys: device_id, data, count")
+        test_result["errors"].extend(self.response_structure_errors(data, self.DEVICE_DETAIL_KEYS))
 
         # 終了時刻以前のデータかチェック
         items = data.get("data", [])
-        end_time = datetime.fromisoformat(params["end_time"].replace('Z', '+00:00'))
-
-        for item in items:
-            item_time = datetime.fromisoformat(item["timestamp"].replace('Z', '+00:00'))
-            if item_time > end_time:
-                test_result["errors"].append(f"Data after end_time: {item['timestamp']}")
-                break
+        out_of_range = self._find_out_of_range(items, end_time=params["end_time"])
+        if out_of_range >= 0:
+            test_result["errors"].append(f"Data after end_time: {items[out_of_range]['timestamp']}")
 
         test_result["success"] = len(test_result["errors"]) == 0
         test_result["response_time"] = result["response_time"]
         test_result["actual_count"] = data.get("count", 0)
 
-        self.test_results.append(test_result)
+        self._record_result(test_result)
         return test_result
 
     # ============================================================================
@@ -448,7 +976,7 @@ class IoTAPISpecTester:
         params = {"status": "sensor_error"}
 
         print(f"Testing 3.3.5: GET /devices/{device_id} with status filter")
-        result = self.make_request(f"/devices/{device_id}", params)
+        result = self.make_request(self.ENDPOINT_SENSOR01, params)
 
         test_result = {
             "test_id": "3.3.5",
@@ -463,30 +991,27 @@ class IoTAPISpecTester:
         # ステータスコード 200 チェック
         if not result["success"]:
             test_result["errors"].append(f"Request failed: {result['error']}")
-            self.test_results.append(test_result)
+            self._record_result(test_result)
             return test_result
 
         data = result["data"]
 
         # 基本構造チェック
-        if not self.validate_response_structure(data, ["device_id", "data", "count"]):
-            test_result["errors"].append("Missing required keys: device_id, data, count")
+        test_result["errors"].extend(self.response_structure_errors(data, self.DEVICE_DETAIL_KEYS))
 
         items = data.get("data", [])
 
-        # 全データのステータス = sensor_error チェック
-        for item in items:
-            if item.get("device_status") != "sensor_error":
-                test_result["errors"].append(f"Found non-error status: {item.get('device_status')}")
-                break
-
-            # temperature値 = null チェック
-            if item.get("temperature") is not None:
+        # 全データのステータス = sensor_error、temperature値 = null チェック
+        bad_item = next((item for item in items
+                         if item.get("device_status") != "sensor_error" or item.get("temperature") is not None), None)
+        if bad_item is not None:
+            if bad_item.get("device_status") != "sensor_error":
+                test_result["errors"].append(f"Found non-error status: {bad_item.get('device_status')}")
+            else:
                 test_result["errors"].append("sensor_error status should have null temperature")
-                break
 
         # エラー率 ≈ 25% (±5%) チェック
-        total_data_result = self.make_request(f"/devices/{device_id}")
+        total_data_result = self._get_device_total(device_id)
         if total_data_result["success"]:
             total_count = total_data_result["data"].get("count", 0)
             error_count = data.get("count", 0)
@@ -515,7 +1040,7 @@ class IoTAPISpecTester:
         test_result["response_time"] = result["response_time"]
         test_result["actual_count"] = data.get("count", 0)
 
-        self.test_results.append(test_result)
+        self._record_result(test_result)
         return test_result
 
     # ============================================================================
@@ -525,13 +1050,13 @@ class IoTAPISpecTester:
         """3.3.6 特定デバイスのテレメトリーデータ取得（複合条件）"""
         device_id = "sensor_01"
         params = {
-            "start_time": "2025-08-01T00:00:00Z",
-            "end_time": "2025-08-01T00:10:00Z",
+            "start_time": self.TIME_RANGE_START,
+            "end_time": self.TIME_RANGE_END,
             "status": "ok"
         }
 
         print(f"Testing 3.3.6: GET /devices/{device_id} with complex conditions")
-        result = self.make_request(f"/devices/{device_id}", params)
+        result = self.make_request(self.ENDPOINT_SENSOR01, params)
 
         test_result = {
             "test_id": "3.3.6",
@@ -545,33 +1070,27 @@ class IoTAPISpecTester:
 
         if not result["success"]:
             test_result["errors"].append(f"Request failed: {result['error']}")
-            self.test_results.append(test_result)
+            self._record_result(test_result)
             return test_result
 
         data = result["data"]
         items = data.get("data", [])
 
         # 時間範囲とステータスの両方をチェック
-        start_time = datetime.fromisoformat(params["start_time"].replace('Z', '+00:00'))
-        end_time = datetime.fromisoformat(params["end_time"].replace('Z', '+00:00'))
+        out_of_range = self._find_out_of_range(items, params["start_time"], params["end_time"])
+        if out_of_range >= 0:
+            test_result["errors"].append(f"Data outside time range: {items[out_of_range]['timestamp']}")
 
-        for item in items:
-            # 時間範囲チェック
-            item_time = datetime.fromisoformat(item["timestamp"].replace('Z', '+00:00'))
-            if not (start_time <= item_time <= end_time):
-                test_result["errors"].append(f"Data outside time range: {item['timestamp']}")
-                break
-
-            # ステータスチェック
-            if item.get("device_status") != "ok":
-                test_result["errors"].append(f"Found non-ok status: {item.get('device_status')}")
-                break
+        # ステータスチェック
+        bad_item = next((item for item in items if item.get("device_status") != "ok"), None)
+        if bad_item is not None:
+            test_result["errors"].append(f"Found non-ok status: {bad_item.get('device_status')}")
 
         test_result["success"] = len(test_result["errors"]) == 0
         test_result["response_time"] = result["response_time"]
         test_result["actual_count"] = data.get("count", 0)
 
-        self.test_results.append(test_result)
+        self._record_result(test_result)
         return test_result
 
     # ============================================================================
@@ -581,7 +1100,8 @@ class IoTAPISpecTester:
         """3.4 デバイス配置部屋一覧取得"""
         device_id = "sensor_01"
         print(f"Testing 3.4: GET /devices/{device_id}/rooms")
-        result = self.make_request(f"/devices/{device_id}/rooms")
+        # レスポンス時間を計測するため、フィクスチャのキャッシュを使わずに送信する
+        result = self.make_request(f"/devices/{device_id}/rooms", use_cache=False)
 
         test_result = {
             "test_id": "3.4",
@@ -594,18 +1114,18 @@ class IoTAPISpecTester:
 
         if not result["success"]:
             test_result["errors"].append(f"Request failed: {result['error']}")
-            self.test_results.append(test_result)
+            self._record_result(test_result)
             return test_result
 
         data = result["data"]
 
         # レスポンス構造チェック
-        if not self.validate_response_structure(data, ["device_id", "rooms", "count"]):
-            test_result["errors"].append("Missing required keys: device_id, rooms, count")
+        test_result["errors"].extend(self.response_structure_errors(data, self.DEVICE_ROOMS_KEYS))
 
         # device_idチェック
-        if data.get("device_id") != device_id:
-            test_result["errors"].append(f"Expected device_id {device_id}, got {data.get('device_id')}")
+        response_device_id = data.get("device_id")
+        if response_device_id != device_id:
+            test_result["errors"].append(f"Expected device_id {device_id}, got {response_device_id}")
 
         # roomsが配列かチェック
         rooms = data.get("rooms", [])
@@ -620,7 +1140,7 @@ class IoTAPISpecTester:
         test_result["response_time"] = result["response_time"]
         test_result["room_count"] = len(rooms)
 
-        self.test_results.append(test_result)
+        self._record_result(test_result)
         return test_result
 
     # ============================================================================
@@ -631,7 +1151,7 @@ class IoTAPISpecTester:
         device_id = "sensor_01"
         room_id = "room_001"
         print(f"Testing 3.5.1: GET /devices/{device_id}/{room_id}")
-        result = self.make_request(f"/devices/{device_id}/{room_id}")
+        result = self.make_request(self.ENDPOINT_SENSOR01_ROOM001)
 
         test_result = {
             "test_id": "3.5.1",
@@ -644,37 +1164,38 @@ class IoTAPISpecTester:
 
         if not result["success"]:
             test_result["errors"].append(f"Request failed: {result['error']}")
-            self.test_results.append(test_result)
+            self._record_result(test_result)
             return test_result
 
         data = result["data"]
 
         # レスポンス構造チェック
-        if not self.validate_response_structure(data, ["device_id", "room_id", "data", "count"]):
-            test_result["errors"].append("Missing required keys: device_id, room_id, data, count")
+        test_result["errors"].extend(self.response_structure_errors(data, self.DEVICE_ROOM_DETAIL_KEYS))
 
         # device_id, room_idチェック
-        if data.get("device_id") != device_id:
-            test_result["errors"].append(f"Expected device_id {device_id}, got {data.get('device_id')}")
+        response_device_id = data.get("device_id")
+        if response_device_id != device_id:
+            test_result["errors"].append(f"Expected device_id {device_id}, got {response_device_id}")
 
-        if data.get("room_id") != room_id:
-            test_result["errors"].append(f"Expected room_id {room_id}, got {data.get('room_id')}")
+        response_room_id = data.get("room_id")
+        if response_room_id != room_id:
+            test_result["errors"].append(f"Expected room_id {room_id}, got {response_room_id}")
 
         # 全てのデータが指定デバイス・部屋のものかチェック
         items = data.get("data", [])
-        for item in items:
-            if item.get("device_id") != device_id:
-                test_result["errors"].append(f"Found data for different device: {item.get('device_id')}")
-                break
-            if item.get("room_id") != room_id:
-                test_result["errors"].append(f"Found data for different room: {item.get('room_id')}")
-                break
+        bad_item = next((item for item in items
+                         if item.get("device_id") != device_id or item.get("room_id") != room_id), None)
+        if bad_item is not None:
+            if bad_item.get("device_id") != device_id:
+                test_result["errors"].append(f"Found data for different device: {bad_item.get('device_id')}")
+            else:
+                test_result["errors"].append(f"Found data for different room: {bad_item.get('room_id')}")
 
         test_result["success"] = len(test_result["errors"]) == 0
         test_result["response_time"] = result["response_time"]
         test_result["actual_count"] = data.get("count", 0)
 
-        self.test_results.append(test_result)
+        self._record_result(test_result)
         return test_result
 
     # ============================================================================
@@ -697,11 +1218,11 @@ class IoTAPISpecTester:
 
         # sensor_01が実際に配置されている部屋を取得
         print(f"Testing 3.5.2: First getting rooms for {device_id}")
-        rooms_result = self.make_request(f"/devices/{device_id}/rooms")
+        rooms_result = self._get_device_rooms(device_id)
 
         if not rooms_result["success"]:
             test_result["errors"].append(f"Failed to get device rooms: {rooms_result['error']}")
-            self.test_results.append(test_result)
+            self._record_result(test_result)
             return test_result
 
         # sensor_01が配置されている部屋を特定
@@ -710,7 +1231,7 @@ class IoTAPISpecTester:
 
         if not assigned_rooms:
             test_result["errors"].append("No rooms found for sensor_01")
-            self.test_results.append(test_result)
+            self._record_result(test_result)
             return test_result
 
         # 配置されている部屋のIDを抽出
@@ -724,12 +1245,13 @@ class IoTAPISpecTester:
         print(f"sensor_01 is assigned to rooms: {assigned_room_ids}")
 
         # self.expected_roomsから未配置の部屋を選択
-        available_rooms = [room_id for room_id in self.expected_rooms if room_id not in assigned_room_ids]
+        assigned_set = frozenset(assigned_room_ids)
+        available_rooms = [room_id for room_id in self.expected_rooms if room_id not in assigned_set]
 
         if not available_rooms:
             test_result["errors"].append(
-                f"All expected rooms {self.expected_rooms} are assigned to sensor_01 - cannot test nonexistent combination")
-            self.test_results.append(test_result)
+                f"All expected rooms {list(self.expected_rooms)} are assigned to sensor_01 - cannot test nonexistent combination")
+            self._record_result(test_result)
             return test_result
 
         # ランダムに未配置の部屋を選択
@@ -744,14 +1266,13 @@ class IoTAPISpecTester:
         # ステータスコード 200 チェック
         if not result["success"]:
             test_result["errors"].append(f"Request failed: {result['error']}")
-            self.test_results.append(test_result)
+            self._record_result(test_result)
             return test_result
 
         data = result["data"]
 
         # レスポンス構造チェック（基本構造は維持されるべき）
-        if not self.validate_response_structure(data, ["device_id", "room_id", "data", "count"]):
-            test_result["errors"].append("Missing required keys: device_id, room_id, data, count")
+        test_result["errors"].extend(self.response_structure_errors(data, self.DEVICE_ROOM_DETAIL_KEYS))
 
         # データ件数 = 0 チェック
         actual_count = data.get("count", 0)
@@ -770,7 +1291,7 @@ class IoTAPISpecTester:
         test_result["assigned_rooms"] = assigned_room_ids
         test_result["available_rooms_count"] = len(available_rooms)
 
-        self.test_results.append(test_result)
+        self._record_result(test_result)
         return test_result
 
     # ============================================================================
@@ -780,7 +1301,7 @@ class IoTAPISpecTester:
         """3.6 部屋一覧取得"""
 
         print("Testing 3.6: GET /rooms")
-        result = self.make_request("/rooms")
+        result = self.make_request(self.ENDPOINT_ROOMS)
 
         test_result = {
             "test_id": "3.6",
@@ -793,14 +1314,13 @@ class IoTAPISpecTester:
 
         if not result["success"]:
             test_result["errors"].append(f"Request failed: {result['error']}")
-            self.test_results.append(test_result)
+            self._record_result(test_result)
             return test_result
 
         data = result["data"]
 
         # レスポンス構造チェック
-        if not self.validate_response_structure(data, ["rooms", "count"]):
-            test_result["errors"].append("Missing required keys: rooms, count")
+        test_result["errors"].extend(self.response_structure_errors(data, self.ROOMS_LIST_KEYS))
 
         # 部屋数チェック
         rooms = data.get("rooms", [])
@@ -834,24 +1354,12 @@ class IoTAPISpecTester:
         test_result["actual_count"] = actual_count
         test_result["expected_count"] = expected_count
 
-        self.test_results.append(test_result)
+        self._record_result(test_result)
         return test_result
 
     def _validate_room_id_format(self, room_id: str) -> bool:
         """部屋ID形式の検証: room_number（numberは0より大きい3桁の数字）"""
-        if not isinstance(room_id, str) or room_id.count('_') != 1:
-            return False
-
-        room_prefix, room_num = room_id.split('_')
-
-        try:
-            if room_prefix != 'room':
-                return False
-
-            num = int(room_num)
-            return num > 0 and len(room_num) == 3 and room_num.isdigit()
-        except ValueError:
-            return False
+        return isinstance(room_id, str) and self.ROOM_ID_PATTERN.fullmatch(room_id) is not None
 
     # ============================================================================
     # テストケース：特定部屋の全デバイステレメトリーデータ取得（基本）
@@ -861,7 +1369,7 @@ class IoTAPISpecTester:
         room_id = "room_001"
 
         print(f"Testing 3.7.1: GET /rooms/{room_id}")
-        result = self.make_request(f"/rooms/{room_id}")
+        result = self.make_request(self.ENDPOINT_ROOM001)
 
         test_result = {
             "test_id": "3.7.1",
@@ -874,18 +1382,18 @@ class IoTAPISpecTester:
 
         if not result["success"]:
             test_result["errors"].append(f"Request failed: {result['error']}")
-            self.test_results.append(test_result)
+            self._record_result(test_result)
             return test_result
 
         data = result["data"]
 
         # レスポンス構造チェック
-        if not self.validate_response_structure(data, ["room_id", "data", "count"]):
-            test_result["errors"].append("Missing required keys: room_id, data, count")
+        test_result["errors"].extend(self.response_structure_errors(data, self.ROOM_DETAIL_KEYS))
 
         # room_idチェック
-        if data.get("room_id") != room_id:
-            test_result["errors"].append(f"Expected room_id {room_id}, got {data.get('room_id')}")
+        response_room_id = data.get("room_id")
+        if response_room_id != room_id:
+            test_result["errors"].append(f"Expected room_id {room_id}, got {response_room_id}")
 
         # データ件数チェック
         actual_count = data.get("count", 0)
@@ -894,17 +1402,12 @@ class IoTAPISpecTester:
 
         # 全てのデータが指定部屋のものかチェック
         items = data.get("data", [])
-        for item in items:
-            if item.get("room_id") != room_id:
-                test_result["errors"].append(f"Found data for different room: {item.get('room_id')}")
-                break
+        bad_item = next((item for item in items if item.get("room_id") != room_id), None)
+        if bad_item is not None:
+            test_result["errors"].append(f"Found data for different room: {bad_item.get('room_id')}")
 
         # ユニークデバイス数チェック
-        unique_devices = set()
-        for item in items:
-            device_id = item.get("device_id")
-            if device_id:
-                unique_devices.add(device_id)
+        unique_devices = {item["device_id"] for item in items if item.get("device_id")}
 
         actual_unique_devices = len(unique_devices)
         if actual_unique_devices != self.devices_per_room:
@@ -918,7 +1421,7 @@ class IoTAPISpecTester:
         test_result["expected_count"] = self.items_per_room
         test_result["expected_unique_devices"] = self.devices_per_room
 
-        self.test_results.append(test_result)
+        self._record_result(test_result)
         return test_result
 
     # ============================================================================
@@ -928,12 +1431,12 @@ class IoTAPISpecTester:
         """3.7.2 特定部屋の全デバイステレメトリーデータ取得（時間範囲指定）"""
         room_id = "room_001"
         params = {
-            "start_time": "2025-08-01T00:00:00Z",
-            "end_time": "2025-08-01T00:10:00Z"
+            "start_time": self.TIME_RANGE_START,
+            "end_time": self.TIME_RANGE_END
         }
 
         print(f"Testing 3.7.2: GET /rooms/{room_id} with time range")
-        result = self.make_request(f"/rooms/{room_id}", params)
+        result = self.make_request(self.ENDPOINT_ROOM001, params)
 
         test_result = {
             "test_id": "3.7.2",
@@ -947,25 +1450,19 @@ class IoTAPISpecTester:
 
         if not result["success"]:
             test_result["errors"].append(f"Request failed: {result['error']}")
-            self.test_results.append(test_result)
+            self._record_result(test_result)
             return test_result
 
         data = result["data"]
 
         # 基本構造チェック
-        if not self.validate_response_structure(data, ["room_id", "data", "count"]):
-            test_result["errors"].append("Missing required keys: room_id, data, count")
+        test_result["errors"].extend(self.response_structure_errors(data, self.ROOM_DETAIL_KEYS))
 
         # 時間範囲内のデータかチェック
         items = data.get("data", [])
-        start_time = datetime.fromisoformat(params["start_time"].replace('Z', '+00:00'))
-        end_time = datetime.fromisoformat(params["end_time"].replace('Z', '+00:00'))
-
-        for item in items:
-            item_time = datetime.fromisoformat(item["timestamp"].replace('Z', '+00:00'))
-            if not (start_time <= item_time <= end_time):
-                test_result["errors"].append(f"Data outside time range: {item['timestamp']}")
-                break
+        out_of_range = self._find_out_of_range(items, params["start_time"], params["end_time"])
+        if out_of_range >= 0:
+            test_result["errors"].append(f"Data outside time range: {items[out_of_range]['timestamp']}")
 
         # データ件数は1000件以下であるべき
         actual_count = data.get("count", 0)
@@ -976,7 +1473,110 @@ class IoTAPISpecTester:
         test_result["response_time"] = result["response_time"]
         test_result["actual_count"] = actual_count
 
-        self.test_results.append(test_result)
+        self._record_result(test_result)
+        return test_result
+
+    # ============================================================================
+    # テストケース：特定部屋の全デバイステレメトリーデータ件数取得
+    # ============================================================================
+    def test_room_detail_summary(self) -> Dict[str, Any]:
+        """3.7.3 特定部屋の全デバイステレメトリーデータ件数取得（summary=true）"""
+        room_id = "room_001"
+        params = {"summary": "true"}
+
+        print(f"Testing 3.7.3: GET /rooms/{room_id} with summary")
+        result = self.make_request(self.ENDPOINT_ROOM001, params, use_cache=False)
+
+        test_result = {
+            "test_id": "3.7.3",
+            "endpoint": f"GET /rooms/{room_id}",
+            "description": "特定部屋の全デバイステレメトリーデータ件数取得（summary=true）",
+            "test_type": "positive",
+            "success": False,
+            "errors": [],
+            "params": params
+        }
+
+        if not result["success"]:
+            test_result["errors"].append(f"Request failed: {result['error']}")
+            self._record_result(test_result)
+            return test_result
+
+        data = result["data"]
+
+        # レスポンス構造チェック（件数のみでdataキーを含まないこと）
+        test_result["errors"].extend(self.response_structure_errors(data, self.ROOM_SUMMARY_KEYS))
+        if "data" in data:
+            test_result["errors"].append("Summary response must not contain 'data' key")
+
+        # 件数が条件なしで取得した件数と一致するかチェック
+        actual_count = data.get("count", 0)
+        full_result = self.make_request(self.ENDPOINT_ROOM001)
+        if not full_result["success"]:
+            test_result["errors"].append(f"Request failed: {full_result['error']}")
+        else:
+            expected_count = full_result["data"].get("count", 0)
+            if actual_count != expected_count:
+                test_result["errors"].append(f"Summary count ({actual_count}) does not match unfiltered count ({expected_count})")
+
+        test_result["success"] = len(test_result["errors"]) == 0
+        test_result["response_time"] = result["response_time"]
+        test_result["actual_count"] = actual_count
+
+        self._record_result(test_result)
+        return test_result
+
+    # ============================================================================
+    # テストケース：特定部屋の全デバイステレメトリーデータ取得（属性指定）
+    # ============================================================================
+    def test_room_detail_fields(self) -> Dict[str, Any]:
+        """3.7.4 特定部屋の全デバイステレメトリーデータ取得（fieldsによる属性指定）"""
+        room_id = "room_001"
+        params = {"fields": self.ROOM_FIELDS}
+
+        print(f"Testing 3.7.4: GET /rooms/{room_id} with fields")
+        result = self.make_request(self.ENDPOINT_ROOM001, params, use_cache=False)
+
+        test_result = {
+            "test_id": "3.7.4",
+            "endpoint": f"GET /rooms/{room_id}",
+            "description": "特定部屋の全デバイステレメトリーデータ取得（属性指定）",
+            "test_type": "positive",
+            "success": False,
+            "errors": [],
+            "params": params
+        }
+
+        if not result["success"]:
+            test_result["errors"].append(f"Request failed: {result['error']}")
+            self._record_result(test_result)
+            return test_result
+
+        data = result["data"]
+
+        # レスポンス構造チェック
+        test_result["errors"].extend(self.response_structure_errors(data, self.ROOM_DETAIL_KEYS))
+
+        # データ件数チェック
+        items = data.get("data", [])
+        actual_count = data.get("count", 0)
+        if actual_count != self.items_per_room:
+            test_result["errors"].append(f"Expected {self.items_per_room} items for room, got {actual_count}")
+        if len(items) != actual_count:
+            test_result["errors"].append(f"Count field ({actual_count}) does not match data items ({len(items)})")
+
+        # 全てのデータが指定した属性のみを持つかチェック
+        expected_keys = self.ROOM_FIELDS_KEYS
+        bad_item = next((item for item in items if item.keys() != expected_keys), None)
+        if bad_item is not None:
+            test_result["errors"].append(
+                f"Expected keys {sorted(expected_keys)}, got {sorted(bad_item.keys())}")
+
+        test_result["success"] = len(test_result["errors"]) == 0
+        test_result["response_time"] = result["response_time"]
+        test_result["actual_count"] = actual_count
+
+        self._record_result(test_result)
         return test_result
 
     # ============================================================================
@@ -986,7 +1586,7 @@ class IoTAPISpecTester:
         """3.8 特定部屋のデバイス一覧取得"""
         room_id = "room_001"
         print(f"Testing 3.8: GET /rooms/{room_id}/devices")
-        result = self.make_request(f"/rooms/{room_id}/devices")
+        result = self.make_request(self.ENDPOINT_ROOM001_DEVICES)
 
         test_result = {
             "test_id": "3.8",
@@ -999,18 +1599,18 @@ class IoTAPISpecTester:
 
         if not result["success"]:
             test_result["errors"].append(f"Request failed: {result['error']}")
-            self.test_results.append(test_result)
+            self._record_result(test_result)
             return test_result
 
         data = result["data"]
 
         # レスポンス構造チェック
-        if not self.validate_response_structure(data, ["room_id", "devices", "count"]):
-            test_result["errors"].append("Missing required keys: room_id, devices, count")
+        test_result["errors"].extend(self.response_structure_errors(data, self.ROOM_DEVICES_KEYS))
 
         # room_idチェック
-        if data.get("room_id") != room_id:
-            test_result["errors"].append(f"Expected room_id {room_id}, got {data.get('room_id')}")
+        response_room_id = data.get("room_id")
+        if response_room_id != room_id:
+            test_result["errors"].append(f"Expected room_id {room_id}, got {response_room_id}")
 
         # デバイス数チェック（各部屋20デバイス）
         devices = data.get("devices", [])
@@ -1018,26 +1618,26 @@ class IoTAPISpecTester:
         if actual_count != self.devices_per_room:
             test_result["errors"].append(f"Expected {self.devices_per_room} devices for room, got {actual_count}")
 
-        # デバイス構造チェック
+        # デバイス構造チェック（正常なデータでは型チェックを省き、不正な要素は例外で検出する）
         device_ids = []
-        for device in devices:
-            if not isinstance(device, dict) or "device_id" not in device:
-                test_result["errors"].append("Invalid device structure")
-                break
-            device_ids.append(device["device_id"])
+        try:
+            for device in devices:
+                device_ids.append(device["device_id"])
+        except (TypeError, KeyError):
+            test_result["errors"].append("Invalid device structure")
 
-        # デバイス重複チェック
-        unique_device_ids = set(device_ids)
-        if len(unique_device_ids) != len(device_ids):
-            duplicates = [device_id for device_id in device_ids if device_ids.count(device_id) > 1]
-            test_result["errors"].append(f"Duplicate devices found: {list(set(duplicates))}")
+        # デバイス重複チェック（1回の走査で各device_idの出現回数を数える）
+        device_id_counts = Counter(device_ids)
+        duplicates = [device_id for device_id, count in device_id_counts.items() if count > 1]
+        if duplicates:
+            test_result["errors"].append(f"Duplicate devices found: {duplicates}")
 
         test_result["success"] = len(test_result["errors"]) == 0
         test_result["response_time"] = result["response_time"]
         test_result["actual_count"] = actual_count
-        test_result["unique_devices"] = len(unique_device_ids)
+        test_result["unique_devices"] = len(device_id_counts)
 
-        self.test_results.append(test_result)
+        self._record_result(test_result)
         return test_result
 
     # ============================================================================
@@ -1048,7 +1648,7 @@ class IoTAPISpecTester:
         room_id = "room_001"
         device_id = "sensor_01"
         print(f"Testing 3.9.1: GET /rooms/{room_id}/{device_id}")
-        result = self.make_request(f"/rooms/{room_id}/{device_id}")
+        result = self.make_request(self.ENDPOINT_ROOM001_SENSOR01)
 
         test_result = {
             "test_id": "3.9.1",
@@ -1061,37 +1661,38 @@ class IoTAPISpecTester:
 
         if not result["success"]:
             test_result["errors"].append(f"Request failed: {result['error']}")
-            self.test_results.append(test_result)
+            self._record_result(test_result)
             return test_result
 
         data = result["data"]
 
         # レスポンス構造チェック
-        if not self.validate_response_structure(data, ["room_id", "device_id", "data", "count"]):
-            test_result["errors"].append("Missing required keys: room_id, device_id, data, count")
+        test_result["errors"].extend(self.response_structure_errors(data, self.ROOM_DEVICE_DETAIL_KEYS))
 
         # room_id, device_idチェック
-        if data.get("room_id") != room_id:
-            test_result["errors"].append(f"Expected room_id {room_id}, got {data.get('room_id')}")
+        response_room_id = data.get("room_id")
+        if response_room_id != room_id:
+            test_result["errors"].append(f"Expected room_id {room_id}, got {response_room_id}")
 
-        if data.get("device_id") != device_id:
-            test_result["errors"].append(f"Expected device_id {device_id}, got {data.get('device_id')}")
+        response_device_id = data.get("device_id")
+        if response_device_id != device_id:
+            test_result["errors"].append(f"Expected device_id {device_id}, got {response_device_id}")
 
         # 全てのデータが指定部屋・デバイスのものかチェック
         items = data.get("data", [])
-        for item in items:
-            if item.get("room_id") != room_id:
-                test_result["errors"].append(f"Found data for different room: {item.get('room_id')}")
-                break
-            if item.get("device_id") != device_id:
-                test_result["errors"].append(f"Found data for different device: {item.get('device_id')}")
-                break
+        bad_item = next((item for item in items
+                         if item.get("room_id") != room_id or item.get("device_id") != device_id), None)
+        if bad_item is not None:
+            if bad_item.get("room_id") != room_id:
+                test_result["errors"].append(f"Found data for different room: {bad_item.get('room_id')}")
+            else:
+                test_result["errors"].append(f"Found data for different device: {bad_item.get('device_id')}")
 
         test_result["success"] = len(test_result["errors"]) == 0
         test_result["response_time"] = result["response_time"]
         test_result["actual_count"] = data.get("count", 0)
 
-        self.test_results.append(test_result)
+        self._record_result(test_result)
         return test_result
 
     # ============================================================================
@@ -1104,7 +1705,7 @@ class IoTAPISpecTester:
         params = {"status": "sensor_error"}
 
         print(f"Testing 3.9.2: GET /rooms/{room_id}/{device_id} with status filter")
-        result = self.make_request(f"/rooms/{room_id}/{device_id}", params)
+        result = self.make_request(self.ENDPOINT_ROOM001_SENSOR01, params)
 
         test_result = {
             "test_id": "3.9.2",
@@ -1118,28 +1719,27 @@ class IoTAPISpecTester:
 
         if not result["success"]:
             test_result["errors"].append(f"Request failed: {result['error']}")
-            self.test_results.append(test_result)
+            self._record_result(test_result)
             return test_result
 
         data = result["data"]
         items = data.get("data", [])
 
         # 全てのデータが指定ステータスかチェック
-        for item in items:
-            if item.get("device_status") != "sensor_error":
-                test_result["errors"].append(f"Found non-error status: {item.get('device_status')}")
-                break
-
-            # sensor_errorの場合、temperatureはnullであるべき
-            if item.get("temperature") is not None:
+        # sensor_errorの場合、temperatureはnullであるべき
+        bad_item = next((item for item in items
+                         if item.get("device_status") != "sensor_error" or item.get("temperature") is not None), None)
+        if bad_item is not None:
+            if bad_item.get("device_status") != "sensor_error":
+                test_result["errors"].append(f"Found non-error status: {bad_item.get('device_status')}")
+            else:
                 test_result["errors"].append("sensor_error status should have null temperature")
-                break
 
         test_result["success"] = len(test_result["errors"]) == 0
         test_result["response_time"] = result["response_time"]
         test_result["actual_count"] = data.get("count", 0)
 
-        self.test_results.append(test_result)
+        self._record_result(test_result)
         return test_result
 
     # ============================================================================
@@ -1162,9 +1762,10 @@ class IoTAPISpecTester:
         test_devices = ["sensor_01", "sensor_02", "sensor_03", "sensor_21", "sensor_41"]
         device_room_mapping = {}
 
-        for device_id in test_devices:
-            result = self.make_request(f"/devices/{device_id}/rooms")
+        results = self.make_requests_concurrently(
+            [(f"/devices/{device_id}/rooms", None) for device_id in test_devices])
 
+        for device_id, result in zip(test_devices, results):
             if not result["success"]:
                 test_result["errors"].append(f"Failed to get rooms for {device_id}: {result['error']}")
                 continue
@@ -1191,7 +1792,7 @@ class IoTAPISpecTester:
         test_result["room_mapping"] = device_room_mapping
         test_result["room_to_devices_mapping"] = room_to_devices
 
-        self.test_results.append(test_result)
+        self._record_result(test_result)
         return test_result
 
     # ============================================================================
@@ -1213,9 +1814,10 @@ class IoTAPISpecTester:
         # 各部屋のセンサー数を確認
         room_sensor_counts = {}
 
-        for room_id in self.expected_rooms:
-            result = self.make_request(f"/rooms/{room_id}/devices")
+        results = self.make_requests_concurrently(
+            [(f"/rooms/{room_id}/devices", None) for room_id in self.expected_rooms])
 
+        for room_id, result in zip(self.expected_rooms, results):
             if not result["success"]:
                 test_result["errors"].append(f"Failed to get devices for {room_id}: {result['error']}")
                 continue
@@ -1234,7 +1836,7 @@ class IoTAPISpecTester:
         test_result["room_counts"] = room_sensor_counts
         test_result["total_rooms_checked"] = len(self.expected_rooms)
 
-        self.test_results.append(test_result)
+        self._record_result(test_result)
         return test_result
 
     # ============================================================================
@@ -1244,20 +1846,14 @@ class IoTAPISpecTester:
         """6.2 デバイスIDバリデーションエラーテスト"""
         print("Testing 6.2: Invalid Device ID Formats")
 
-        invalid_device_ids = [
-            ("sensor01", "アンダースコアなし"),
-            ("sensor_01_temp", "複数アンダースコア"),
-            ("sensor_00", "数値部分が0"),
-            ("sensor_-1", "負の数値"),
-            ("sensor_abc", "数値部分が文字列"),
-            ("_01", "空のデバイスタイプ")
-        ]
-
         test_results = []
 
-        for invalid_id, description in invalid_device_ids:
+        # 各ケースのリクエストは互いに独立しているため先にまとめて並列送信し、結果を順番に検証する
+        results = self.make_requests_concurrently(
+            [(f"/devices/{invalid_id}", None) for invalid_id, _ in self.INVALID_DEVICE_ID_CASES], expect_error=True)
+
+        for (invalid_id, description), result in zip(self.INVALID_DEVICE_ID_CASES, results):
             print(f"  Testing invalid device_id: {invalid_id} ({description})")
-            result = self.make_request(f"/devices/{invalid_id}", expect_error=True)
 
             test_result = {
                 "test_id": f"6.2.{len(test_results) + 1}",
@@ -1275,7 +1871,7 @@ class IoTAPISpecTester:
             # エラーレスポンスの構造チェック（大文字小文字を無視）
             if result.get("data") or result.get("response_data"):
                 error_data = result.get("data") or result.get("response_data")
-                validation_errors = self.validate_error_response(error_data, 400, "Validation failed")
+                validation_errors = self.validate_error_response(error_data, 400, self.ERROR_VALIDATION_FAILED)
                 test_result["errors"].extend(validation_errors)
             else:
                 test_result["errors"].append("No error response data received")
@@ -1284,7 +1880,7 @@ class IoTAPISpecTester:
             test_result["response_time"] = result.get("response_time", 0)
 
             test_results.append(test_result)
-            self.test_results.append(test_result)
+            self._record_result(test_result)
 
         return test_results
 
@@ -1295,31 +1891,13 @@ class IoTAPISpecTester:
         """6.3 部屋IDバリデーションエラーテスト"""
         print("Testing 6.3: Invalid Room ID Formats")
 
-        invalid_room_tests = [
-            ("/rooms/%20", "スペースのみの部屋ID", "room_id with spaces only"),
-            # ("/rooms/_", "アンダースコアのみ", "room_id with underscore only"),
-            # ("/rooms/room01", "2桁の数値部分", "room_id with 2-digit number"),
-            # ("/rooms/room_0001", "4桁の数値部分", "room_id with 4-digit number"),
-            # ("/rooms/room_000", "数値部分が0", "room_id with zero number"),
-            # ("/rooms/room_-01", "負の数値", "room_id with negative number"),
-            # ("/rooms/room_abc", "数値部分が文字列", "room_id with non-numeric part"),
-            # ("/rooms/room__001", "複数のアンダースコア", "room_id with multiple underscores"),
-            # ("/rooms/room001", "アンダースコアなし", "room_id without underscore"),
-            # ("/rooms/office_001", "不正なプレフィックス", "room_id with wrong prefix"),
-            # ("/rooms/_001", "空のプレフィックス", "room_id with empty prefix"),
-            # ("/rooms/room_", "空の数値部分", "room_id with empty number part"),
-            # ("/rooms/room_01a", "数値部分に文字が混在", "room_id with mixed alphanumeric"),
-            # ("/rooms/room_1.0", "小数点を含む数値", "room_id with decimal number"),
-            # ("/rooms/ROOM_001", "大文字のプレフィックス", "room_id with uppercase prefix"),
-            # ("/rooms/room_+01", "正の符号付き数値", "room_id with positive sign"),
-            # ("/rooms/room_00a", "先頭0で文字が混在", "room_id with leading zero and letter")
-        ]
-
         test_results = []
 
-        for endpoint, description, test_desc in invalid_room_tests:
+        results = self.make_requests_concurrently(
+            [(endpoint, None) for endpoint, _, _ in self.INVALID_ROOM_ID_CASES], expect_error=True)
+
+        for (endpoint, description, test_desc), result in zip(self.INVALID_ROOM_ID_CASES, results):
             print(f"  Testing invalid room_id: {endpoint} ({description})")
-            result = self.make_request(endpoint, expect_error=True)
 
             test_result = {
                 "test_id": f"6.3.{len(test_results) + 1}",
@@ -1341,8 +1919,8 @@ class IoTAPISpecTester:
                     test_result["errors"].append("Missing 'error' key in error response")
                 else:
                     # バリデーションエラーメッセージの確認（大文字小文字を無視）
-                    error_message = error_data["error"].lower()
-                    if "validation" not in error_message and "invalid" not in error_message:
+                    error_message = error_data["error"].casefold()
+                    if self.ERROR_VALIDATION not in error_message and self.ERROR_INVALID not in error_message:
                         # 一部のケースでは404が適切な場合もある
                         if result["status_code"] != 404:
                             test_result["errors"].append(
@@ -1354,7 +1932,7 @@ class IoTAPISpecTester:
             test_result["response_time"] = result.get("response_time", 0)
 
             test_results.append(test_result)
-            self.test_results.append(test_result)
+            self._record_result(test_result)
 
         return test_results
 
@@ -1365,22 +1943,15 @@ class IoTAPISpecTester:
         """6.4 タイムスタンプバリデーションエラーテスト"""
         print("Testing 6.4: Invalid Timestamp Formats")
 
-        invalid_timestamps = [
-            ("2025-13-01T00:00:00Z", "不正な月"),
-            ("2025-08-01T25:00:00Z", "不正な時刻"),
-            ("2025/08/01 10:00:00", "ISO形式でない"),
-            ("2025-08-01T10:00:00", "タイムゾーン指定なし"),
-            ("invalid_timestamp", "完全に不正な文字列"),
-            ("2025-02-30T10:00:00Z", "存在しない日付")
-        ]
-
         test_results = []
         device_id = "sensor_01"
 
-        for invalid_timestamp, description in invalid_timestamps:
+        params_list = [{"start_time": invalid_timestamp} for invalid_timestamp, _ in self.INVALID_TIMESTAMP_CASES]
+        results = self.make_requests_concurrently(
+            [(self.ENDPOINT_SENSOR01, params) for params in params_list], expect_error=True)
+
+        for (invalid_timestamp, description), params, result in zip(self.INVALID_TIMESTAMP_CASES, params_list, results):
             print(f"  Testing invalid timestamp: {invalid_timestamp} ({description})")
-            params = {"start_time": invalid_timestamp}
-            result = self.make_request(f"/devices/{device_id}", params, expect_error=True)
 
             test_result = {
                 "test_id": f"6.4.{len(test_results) + 1}",
@@ -1399,7 +1970,7 @@ class IoTAPISpecTester:
             # エラーレスポンスの構造チェック（大文字小文字を無視）
             if result.get("data") or result.get("response_data"):
                 error_data = result.get("data") or result.get("response_data")
-                validation_errors = self.validate_error_response(error_data, 400, "validation failed")
+                validation_errors = self.validate_error_response(error_data, 400, self.ERROR_VALIDATION_FAILED)
                 test_result["errors"].extend(validation_errors)
             else:
                 test_result["errors"].append("No error response data received")
@@ -1408,7 +1979,7 @@ class IoTAPISpecTester:
             test_result["response_time"] = result.get("response_time", 0)
 
             test_results.append(test_result)
-            self.test_results.append(test_result)
+            self._record_result(test_result)
 
         return test_results
 
@@ -1419,21 +1990,15 @@ class IoTAPISpecTester:
         """6.5 ステータスバリデーションエラーテスト"""
         print("Testing 6.5: Invalid Status Values")
 
-        invalid_statuses = [
-            ("broken", "存在しないステータス"),
-            ("OK", "大文字小文字混在"),
-            ("1", "数値ステータス"),
-            ("error", "部分的に正しいが無効"),
-            ("SENSOR_ERROR", "全て大文字")
-        ]
-
         test_results = []
         device_id = "sensor_01"
 
-        for invalid_status, description in invalid_statuses:
+        params_list = [{"status": invalid_status} for invalid_status, _ in self.INVALID_STATUS_CASES]
+        results = self.make_requests_concurrently(
+            [(self.ENDPOINT_SENSOR01, params) for params in params_list], expect_error=True)
+
+        for (invalid_status, description), params, result in zip(self.INVALID_STATUS_CASES, params_list, results):
             print(f"  Testing invalid status: {invalid_status} ({description})")
-            params = {"status": invalid_status}
-            result = self.make_request(f"/devices/{device_id}", params, expect_error=True)
 
             test_result = {
                 "test_id": f"6.5.{len(test_results) + 1}",
@@ -1452,7 +2017,7 @@ class IoTAPISpecTester:
             # エラーレスポンスの構造チェック（大文字小文字を無視）
             if result.get("data") or result.get("response_data"):
                 error_data = result.get("data") or result.get("response_data")
-                validation_errors = self.validate_error_response(error_data, 400, "validation failed")
+                validation_errors = self.validate_error_response(error_data, 400, self.ERROR_VALIDATION_FAILED)
                 test_result["errors"].extend(validation_errors)
             else:
                 test_result["errors"].append("No error response data received")
@@ -1461,7 +2026,7 @@ class IoTAPISpecTester:
             test_result["response_time"] = result.get("response_time", 0)
 
             test_results.append(test_result)
-            self.test_results.append(test_result)
+            self._record_result(test_result)
 
         return test_results
 
@@ -1472,17 +2037,13 @@ class IoTAPISpecTester:
         """6.6 複合バリデーションエラーテスト"""
         print("Testing 6.6: Complex Validation Errors")
 
-        complex_error_tests = [
-            ("invalid_device", {"start_time": "invalid_time"}, "デバイスID + タイムスタンプエラー"),
-            ("bad_device", {"start_time": "bad_time", "end_time": "bad_end", "status": "bad_status"},
-             "全パラメータエラー")
-        ]
-
         test_results = []
 
-        for device_id, params, description in complex_error_tests:
+        results = self.make_requests_concurrently(
+            [(f"/devices/{device_id}", params) for device_id, params, _ in self.COMPLEX_VALIDATION_ERROR_CASES], expect_error=True)
+
+        for (device_id, params, description), result in zip(self.COMPLEX_VALIDATION_ERROR_CASES, results):
             print(f"  Testing complex validation: {device_id} with {params} ({description})")
-            result = self.make_request(f"/devices/{device_id}", params, expect_error=True)
 
             test_result = {
                 "test_id": f"6.6.{len(test_results) + 1}",
@@ -1501,7 +2062,7 @@ class IoTAPISpecTester:
             # エラーレスポンスの構造チェック（大文字小文字を無視）
             if result.get("data") or result.get("response_data"):
                 error_data = result.get("data") or result.get("response_data")
-                validation_errors = self.validate_error_response(error_data, 400, "Validation failed")
+                validation_errors = self.validate_error_response(error_data, 400, self.ERROR_VALIDATION_FAILED)
                 test_result["errors"].extend(validation_errors)
             else:
                 test_result["errors"].append("No error response data received")
@@ -1510,7 +2071,7 @@ class IoTAPISpecTester:
             test_result["response_time"] = result.get("response_time", 0)
 
             test_results.append(test_result)
-            self.test_results.append(test_result)
+            self._record_result(test_result)
 
         return test_results
 
@@ -1521,17 +2082,13 @@ class IoTAPISpecTester:
         """6.7 存在しないエンドポイントテスト"""
         print("Testing 6.7: Non-existent Routes")
 
-        invalid_routes = [
-            ("/nonexistent", "存在しないパス"),
-            ("/devices/sensor_01/room_001/invalid", "存在しないサブパス"),
-            ("/rooms/room_001/sensor_01/invalid", "存在しない部屋サブパス")
-        ]
-
         test_results = []
 
-        for route, description in invalid_routes:
+        results = self.make_requests_concurrently(
+            [(route, None) for route, _ in self.NONEXISTENT_ROUTE_CASES], expect_error=True)
+
+        for (route, description), result in zip(self.NONEXISTENT_ROUTE_CASES, results):
             print(f"  Testing non-existent route: {route} ({description})")
-            result = self.make_request(route, expect_error=True)
 
             test_result = {
                 "test_id": f"6.7.{len(test_results) + 1}",
@@ -1555,10 +2112,9 @@ class IoTAPISpecTester:
                     test_result["errors"].append("Missing 'message' key in API Gateway error response")
                 else:
                     # Case-insensitive comparison
-                    actual_message = error_data["message"].lower()
-                    expected_message = "missing authentication token"
+                    actual_message = error_data["message"].casefold()
 
-                    if expected_message not in actual_message:
+                    if self.ERROR_MISSING_AUTH_TOKEN not in actual_message:
                         test_result["errors"].append(
                             f"Expected message containing 'Missing Authentication Token' (case-insensitive), got '{error_data['message']}'"
                         )
@@ -1569,7 +2125,98 @@ class IoTAPISpecTester:
             test_result["response_time"] = result.get("response_time", 0)
 
             test_results.append(test_result)
-            self.test_results.append(test_result)
+            self._record_result(test_result)
+
+        return test_results
+
+    # ============================================================================
+    # テストケース：ページングパラメータバリデーションエラー
+    # ============================================================================
+    def test_invalid_pagination_params(self) -> List[Dict[str, Any]]:
+        """6.8 ページングパラメータ（limit/page_token）バリデーションエラーテスト"""
+        print("Testing 6.8: Invalid Pagination Parameters")
+
+        test_results = []
+
+        results = self.make_requests_concurrently(
+            [(self.ENDPOINT_ROOT, params) for params, _ in self.INVALID_PAGINATION_CASES], expect_error=True)
+
+        for (params, description), result in zip(self.INVALID_PAGINATION_CASES, results):
+            print(f"  Testing invalid pagination: {params} ({description})")
+
+            test_result = {
+                "test_id": f"6.8.{len(test_results) + 1}",
+                "endpoint": "GET /",
+                "description": f"ページングパラメータバリデーションエラー: {description}",
+                "test_type": "negative",
+                "success": False,
+                "errors": [],
+                "params": params
+            }
+
+            # 400エラーが返されることを期待
+            if result["status_code"] != 400:
+                test_result["errors"].append(f"Expected status 400, got {result['status_code']}")
+
+            # エラーレスポンスの構造チェック（大文字小文字を無視）
+            if result.get("data") or result.get("response_data"):
+                error_data = result.get("data") or result.get("response_data")
+                validation_errors = self.validate_error_response(error_data, 400, self.ERROR_QUERY_VALIDATION_FAILED)
+                test_result["errors"].extend(validation_errors)
+            else:
+                test_result["errors"].append("No error response data received")
+
+            test_result["success"] = len(test_result["errors"]) == 0
+            test_result["response_time"] = result.get("response_time", 0)
+
+            test_results.append(test_result)
+            self._record_result(test_result)
+
+        return test_results
+
+    # ============================================================================
+    # テストケース：部屋データ取得オプションのバリデーションエラー
+    # ============================================================================
+    def test_invalid_room_query_params(self) -> List[Dict[str, Any]]:
+        """6.9 部屋データ取得オプション（fields/summary）バリデーションエラーテスト"""
+        print("Testing 6.9: Invalid Room Query Parameters")
+
+        test_results = []
+        room_id = "room_001"
+
+        results = self.make_requests_concurrently(
+            [(self.ENDPOINT_ROOM001, params) for params, _ in self.INVALID_ROOM_QUERY_CASES], expect_error=True)
+
+        for (params, description), result in zip(self.INVALID_ROOM_QUERY_CASES, results):
+            print(f"  Testing invalid room query: {params} ({description})")
+
+            test_result = {
+                "test_id": f"6.9.{len(test_results) + 1}",
+                "endpoint": f"GET /rooms/{room_id}",
+                "description": f"部屋データ取得オプションバリデーションエラー: {description}",
+                "test_type": "negative",
+                "success": False,
+                "errors": [],
+                "params": params
+            }
+
+            # 400エラーが返されることを期待
+            if result["status_code"] != 400:
+                test_result["errors"].append(f"Expected status 400, got {result['status_code']}")
+
+            # エラーレスポンスの構造チェック（大文字小文字を無視）
+            if result.get("data") or result.get("response_data"):
+                error_data = result.get("data") or result.get("response_data")
+                validation_errors = self.validate_error_response(error_data, 400, self.ERROR_QUERY_VALIDATION_FAILED)
+                test_result["errors"].extend(validation_errors)
+            else:
+                test_result["errors"].append("No error response data received")
+
+            test_result["success"] = len(test_result["errors"]) == 0
+            test_result["response_time"] = result.get("response_time", 0)
+
+            test_results.append(test_result)
+            self._record_result(test_result)
 
         return test_results
 
@@ -1579,27 +2226,35 @@ class IoTAPISpecTester:
     def run_all_tests(self) -> Dict[str, Any]:
         """全てのAPI仕様テスト（正常系 + バリデーションエラー系）を実行"""
         print("=== IoT API 包括的テスト開始 ===\n")
-        start_time = time.time()
-
-        # 正常系テスト実行
-        print("--- 正常系テスト ---")
-        self.test_root_endpoint()  # 3.1
-        self.test_devices_list()  # 3.2
-        self.test_device_detail_basic()  # 3.3.1
-        self.test_device_detail_time_range()  # 3.3.2
-        self.test_device_detail_start_time_only()  # 3.3.3
-        self.test_device_detail_end_time_only()  # 3.3.4
-        self.test_device_detail_status_filter()  # 3.3.5
-        self.test_device_detail_complex_conditions()  # 3.3.6
-        self.test_device_rooms()  # 3.4
-        self.test_device_room_detail_basic()  # 3.5.1
-        self.test_device_room_detail_nonexistent()  # 3.5.2
-        self.test_rooms_list()  # 3.6
-        self.test_room_detail_basic()  # 3.7.1
-        self.test_room_detail_time_range()  # 3.7.2
-        self.test_room_devices()  # 3.8
-        self.test_room_device_detail_basic()  # 3.9.1
-        self.test_room_device_detail_status_filter()  # 3.9.2
+        start_time = time.perf_counter()
+
+        # 共有フィクスチャの準備
+        self.setup_fixtures()
+
+        # 正常系テスト実行（各テストは読み取りのみで互いに依存しないため並列実行）
+        print("\n--- 正常系テスト ---")
+        self.run_tests_concurrently([
+            self.test_root_endpoint,  # 3.1
+            self.test_root_endpoint_paging,  # 3.1.1
+            self.test_devices_list,  # 3.2
+            self.test_device_detail_basic,  # 3.3.1
+            self.test_device_detail_time_range,  # 3.3.2
+            self.test_device_detail_start_time_only,  # 3.3.3
+            self.test_device_detail_end_time_only,  # 3.3.4
+            self.test_device_detail_status_filter,  # 3.3.5
+            self.test_device_detail_complex_conditions,  # 3.3.6
+            self.test_device_rooms,  # 3.4
+            self.test_device_room_detail_basic,  # 3.5.1
+            self.test_device_room_detail_nonexistent,  # 3.5.2
+            self.test_rooms_list,  # 3.6
+            self.test_room_detail_basic,  # 3.7.1
+            self.test_room_detail_time_range,  # 3.7.2
+            self.test_room_detail_summary,  # 3.7.3
+            self.test_room_detail_fields,  # 3.7.4
+            self.test_room_devices,  # 3.8
+            self.test_room_device_detail_basic,  # 3.9.1
+            self.test_room_device_detail_status_filter,  # 3.9.2
+        ])
 
         # データ整合性テスト実行
         print("\n--- データ整合性テスト ---")
@@ -1614,8 +2269,10 @@ class IoTAPISpecTester:
         self.test_invalid_status_values()  # 6.5
         self.test_complex_validation_errors()  # 6.6
         self.test_nonexistent_routes()  # 6.7
+        self.test_invalid_pagination_params()  # 6.8
+        self.test_invalid_room_query_params()  # 6.9
 
-        end_time = time.time()
+        end_time = time.perf_counter()
         total_time = end_time - start_time
 
         # テスト結果サマリー
@@ -1671,9 +2328,13 @@ class IoTAPISpecTester:
         return summary
 
     def save_test_results(self, filename: str = "comprehensive_api_test_results.json"):
-        """テスト結果をファイルに保存"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.test_results, f, indent=2, ensure_ascii=False)
+        """テスト結果をファイルに保存（orjsonがあればUTF-8のバイト列を直接書き出す）"""
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(self.test_results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(self.test_results, f, indent=2, ensure_ascii=False)
         print(f"包括的テスト結果を {filename} に保存しました。")
 
 
@@ -1685,8 +2346,9 @@ if __name__ == "__main__":
     API_BASE_URL = "https://4zutuzta2b.execute-api.ap-northeast-1.amazonaws.com/dev"
 
     # テスト実行
-    tester = IoTAPISpecTester(API_BASE_URL)
-    results = tester.run_all_tests()
+    # withブロックを抜けた時点でセッションを閉じ、プール済みの接続を解放する
+    with IoTAPISpecTester(API_BASE_URL) as tester:
+        results = tester.run_all_tests()
 
-    # 結果をファイルに保存
-    tester.save_test_results()
+        # 結果をファイルに保存
+        tester.save_test_results()
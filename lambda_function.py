@@ -1,70 +1,124 @@
 import json
+import base64
 import boto3
 import os
-from typing import Dict, List, Optional, Any, Union, Tuple
-from functools import reduce, partial
+import time
+from typing import Dict, List, Optional, Any, Tuple, Iterator, Callable, Set
+from functools import partial, lru_cache, wraps
 from datetime import datetime
 import re
-from decimal import Decimal
-from boto3.dynamodb.conditions import Key, Attr
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.config import Config
+
+try:
+    import orjson  # 高速JSONエンコーダー（未インストール時は標準のjsonで直列化）
+except ImportError:
+    orjson = None
 
 # 環境変数からDynamoDBテーブル名を取得
 TABLE_NAME = os.environ.get('DYNAMODB_TABLE')
 if not TABLE_NAME:
     raise ValueError("DYNAMODB_TABLE environment variable is required")
 
-dynamodb = boto3.resource('dynamodb')
-table = dynamodb.Table(TABLE_NAME)
+# 接続はモジュールレベルで作成し、ウォームコンテナの呼び出し間で再利用する
+# 並列スキャンの同時リクエストが接続待ちにならないよう、接続プールを既定の10より大きくする
+# Resourceの条件オブジェクトや自動型変換を経由せず、低レベルクライアントで直接クエリを実行する
+MAX_POOL_CONNECTIONS = 50
+client = boto3.client('dynamodb', config=Config(
+    max_pool_connections=MAX_POOL_CONNECTIONS,
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+    tcp_keepalive=True
+))
+
+# 初期化フェーズで1回だけ軽量なAPIを呼び、認証情報の解決・エンドポイント解決・TLSハンドシェイクを済ませておく
+# 最初のリクエストの処理時間にこれらの遅延を含めないため（失敗しても通常のリクエスト時に再試行されるので無視する）
+try:
+    client.describe_table(TableName=TABLE_NAME)
+except Exception:
+    pass
+
+# レスポンスのDynamoDB JSON形式（{'S': ...}など）はモジュールレベルで1つだけ作成したデシリアライザーで変換
+deserializer = TypeDeserializer()
 
 # GSI名 - room_idをパーティションキー、timestampをソートキーとするインデックス
 GSI_NAME = "room_id-timestamp-index"
 
+# APIレスポンスに含めるテレメトリーデータの属性
+# timestampはDynamoDBの予約語のため、プロジェクションでは属性名プレースホルダーを使用する
+TELEMETRY_ATTRIBUTES = ('device_id', 'room_id', 'timestamp', 'temperature', 'device_status')
+TELEMETRY_PROJECTION = {
+    'ProjectionExpression': ', '.join(f'#{name}' for name in TELEMETRY_ATTRIBUTES),
+    'ExpressionAttributeNames': {f'#{name}': name for name in TELEMETRY_ATTRIBUTES}
+}
+
+# 並列スキャンのセグメント数 - 各セグメントを別スレッドでスキャンし、DynamoDBへの往復待ちを重ねる
+# テーブルサイズやLambdaのメモリ（vCPU）設定に合わせて環境変数で調整可能
+# 各セグメントが接続を1つ使うため、1以上・接続プールの上限以下に収める
+SCAN_SEGMENTS = min(max(int(os.environ.get('SCAN_SEGMENTS', '4')), 1), MAX_POOL_CONNECTIONS)
+
+# ウォームコンテナの呼び出し間でスレッドを再利用するため、エグゼキューターはモジュールレベルで1つだけ作成
+scan_executor = ThreadPoolExecutor(max_workers=SCAN_SEGMENTS)
+
+# キャッシュ有効期間（秒） - ウォームコンテナではこの間スキャン・クエリを省略
+# デバイス・部屋の一覧はほとんど変わらないため長め、配置情報は一覧より短めに設定
+ROOMS_CACHE_TTL_SECONDS = float(os.environ.get('ROOMS_CACHE_TTL_SECONDS', '300'))
+DEVICES_CACHE_TTL_SECONDS = float(os.environ.get('DEVICES_CACHE_TTL_SECONDS', '300'))
+ROOM_DEVICES_CACHE_TTL_SECONDS = float(os.environ.get('ROOM_DEVICES_CACHE_TTL_SECONDS', '120'))
+DEVICE_ROOMS_CACHE_TTL_SECONDS = float(os.environ.get('DEVICE_ROOMS_CACHE_TTL_SECONDS', '60'))
+
+# GET / のページサイズ - limit未指定でpage_tokenのみ指定された場合の既定値と、limitの上限
+DEFAULT_PAGE_LIMIT = 1000
+MAX_PAGE_LIMIT = 1000
+
+# キャッシュの最大件数 - デバイス・部屋ごとのエントリが増え続けないよう、古く使われていないものから破棄
+CACHE_MAX_ENTRIES = 512
+
+# テレメトリーデータのレスポンスキャッシュ - 同じ条件でポーリングするダッシュボード向けに短時間だけ保持
+# 本文がRESPONSE_CACHE_MAX_BODY_SIZE（文字数）を超えるレスポンスはキャッシュしないため、
+# キャッシュ全体のメモリ使用量は最大でもエントリ数 × 本文サイズ上限に収まる
+RESPONSE_CACHE_TTL_SECONDS = float(os.environ.get('RESPONSE_CACHE_TTL_SECONDS', '10'))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get('RESPONSE_CACHE_MAX_ENTRIES', '256'))
+RESPONSE_CACHE_MAX_BODY_SIZE = int(os.environ.get('RESPONSE_CACHE_MAX_BODY_SIZE', '65536'))
+
 
 # ============================================================================
 # バリデーション関数
 # ============================================================================
 
+# バリデーション結果のキャッシュ件数 - 同じID・時刻・ステータスはウォームコンテナ内で繰り返し検証されるため
+VALIDATION_CACHE_SIZE = 4096
+
+# デバイスID: 英数字のデバイス種別 + '_' + 0より大きい数値（sensor_01のような先頭0は許可）
+DEVICE_ID_PATTERN = re.compile(r'[A-Za-z0-9]+_0*[1-9][0-9]*')
+
+# 部屋ID: 'room_' + 0より大きい3桁の数字（000は否定先読みで除外）
+ROOM_ID_PATTERN = re.compile(r'room_(?!000)[0-9]{3}')
+
+# デバイスステータスの許可値（厳密な小文字のみ）
+VALID_STATUSES = frozenset({'ok', 'sensor_error', 'offline', 'maintenance'})
+
+
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
 def validate_device_id(device_id: str) -> bool:
     """
     デバイスID形式の検証: device_type_number（numberは0より大きい）
     例: fridge_01, sensor_42, thermostat_5
     """
-    if not isinstance(device_id, str) or device_id.count('_') != 1:
-        return False
-
-    device_type, device_num = device_id.split('_')
-
-    try:
-        num = int(device_num)
-        return isinstance(device_type, str) and len(device_type) > 0 and num > 0
-    except ValueError:
-        return False
+    return isinstance(device_id, str) and DEVICE_ID_PATTERN.fullmatch(device_id) is not None
 
 
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
 def validate_room_id(room_id: str) -> bool:
     """
     部屋ID形式の検証: room_number（numberは0より大きい3桁の数字）
     例: room_001, room_002, room_010, room_100
     """
-    if not isinstance(room_id, str) or room_id.count('_') != 1:
-        return False
-
-    room_prefix, room_num = room_id.split('_')
-
-    try:
-        # プレフィックスが'room'であることを確認
-        if room_prefix != 'room':
-            return False
-
-        # 数値部分が正の整数であることを検証
-        num = int(room_num)
-
-        # 数値が0より大きく、3桁の形式（001, 002など）であることを確認
-        return num > 0 and len(room_num) == 3 and room_num.isdigit()
-    except ValueError:
-        return False
+    return isinstance(room_id, str) and ROOM_ID_PATTERN.fullmatch(room_id) is not None
 
 
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
 def validate_timestamp(timestamp: str) -> bool:
     """
     UTC形式タイムスタンプを検証: YYYY-MM-DDTHH:MM:SSZ（Z必須）
@@ -84,13 +138,42 @@ def validate_timestamp(timestamp: str) -> bool:
         return False
 
 
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
 def validate_status(status: str) -> bool:
     """
     厳密な小文字ステータス値のみを許可
     許可値: 'ok', 'sensor_error', 'offline', 'maintenance'
     """
-    valid_statuses = {'ok', 'sensor_error', 'offline', 'maintenance'}
-    return isinstance(status, str) and status in valid_statuses
+    return isinstance(status, str) and status in VALID_STATUSES
+
+
+def validate_limit(limit: str) -> bool:
+    """
+    1ページあたりの件数を検証: 1以上MAX_PAGE_LIMIT以下の整数
+    """
+    return isinstance(limit, str) and limit.isascii() and limit.isdigit() and 1 <= int(limit) <= MAX_PAGE_LIMIT
+
+
+def validate_page_token(page_token: str) -> bool:
+    """
+    ページトークンを検証: 前ページのレスポンスで返したnext_page_tokenとしてデコードできること
+    """
+    return decode_page_token(page_token) is not None
+
+
+def validate_fields(fields: str) -> bool:
+    """
+    取得属性の指定を検証: テレメトリーデータの属性名をカンマ区切りで1つ以上
+    例: timestamp,device_status
+    """
+    return isinstance(fields, str) and all(field in TELEMETRY_ATTRIBUTES for field in fields.split(','))
+
+
+def validate_summary(summary: str) -> bool:
+    """
+    サマリー指定を検証: 'true' または 'false'（小文字のみ）
+    """
+    return summary in ('true', 'false')
 
 # ============================================================================
 # パラメータ抽出関数
@@ -110,32 +193,300 @@ def extract_path_params(event: Dict[str, Any]) -> Dict[str, str]:
 # バリデーションパイプライン
 # ============================================================================
 
-def validate_params(params: Dict[str, Any], validators: Dict[str, callable]) -> Tuple[bool, List[str]]:
+# エンドポイント別のバリデーター定義（関数参照のみのため、リクエストごとに作り直さずモジュールレベルで共有）
+# (パラメータ名, バリデーター) のタプルとして持ち、検証時は辞書を介さずそのまま展開してループする
+DEVICE_PATH_VALIDATORS = (('device_id', validate_device_id),)
+ROOM_PATH_VALIDATORS = (('room_id', validate_room_id),)
+DEVICE_ROOM_PATH_VALIDATORS = (('device_id', validate_device_id), ('room_id', validate_room_id))
+ROOM_DEVICE_PATH_VALIDATORS = (('room_id', validate_room_id), ('device_id', validate_device_id))
+TIME_RANGE_QUERY_VALIDATORS = (('start_time', validate_timestamp), ('end_time', validate_timestamp))
+TELEMETRY_QUERY_VALIDATORS = TIME_RANGE_QUERY_VALIDATORS + (('status', validate_status),)
+ROOM_QUERY_VALIDATORS = TIME_RANGE_QUERY_VALIDATORS + (('fields', validate_fields), ('summary', validate_summary))
+PAGINATION_QUERY_VALIDATORS = (('limit', validate_limit), ('page_token', validate_page_token))
+
+Validators = Tuple[Tuple[str, Callable[[str], bool]], ...]
+
+
+def validate_params(params: Dict[str, Any], validators: Validators) -> Tuple[bool, List[str]]:
     """
     複数パラメータを一括検証
+    検証対象のパラメータ（validatorsのパラメータ名）だけを参照し、値がないパラメータは検証しない
     Returns: (検証成功フラグ, エラーメッセージリスト)
     """
     errors = []
 
-    for param, value in params.items():
-        if param in validators and value is not None:
-            if not validators[param](value):
-                errors.append(f"Invalid {param}: {value}")
+    for param, validator in validators:
+        value = params.get(param)
+        if value is not None and not validator(value):
+            errors.append(f"Invalid {param}: {value}")
 
     return len(errors) == 0, errors
 
 
+def validate_request(path_values: Dict[str, Any], path_validators: Validators,
+                     query_values: Optional[Dict[str, Any]] = None,
+                     query_validators: Optional[Validators] = None) -> Optional[Dict]:
+    """
+    パスパラメータとクエリパラメータを1回の呼び出しで検証
+    パスパラメータのエラーを優先し、クエリパラメータのエラーとはエラーメッセージを分けて返す
+    Returns: 検証エラー時は400エラーレスポンス、問題がなければNone
+    """
+    is_valid, errors = validate_params(path_values, path_validators)
+    if not is_valid:
+        return create_error_response(400, "Validation failed", errors)
+
+    if query_values and query_validators:
+        is_valid, errors = validate_params(query_values, query_validators)
+        if not is_valid:
+            return create_error_response(400, "Query parameter validation failed", errors)
+
+    return None
+
+
+# ============================================================================
+# キャッシュ
+# ============================================================================
+
+# キャッシュキー -> (取得時刻, 値)。モジュールレベルに置き、同一コンテナの呼び出し間で共有する
+# 参照順を保持し、CACHE_MAX_ENTRIESを超えたら最も長く参照されていないエントリから破棄（LRU）
+_CACHE: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+
+# (ハンドラー名, パスパラメータ, クエリパラメータ) -> (作成時刻, レスポンス)。RESPONSE_CACHE_MAX_ENTRIESでLRU破棄
+_RESPONSE_CACHE: 'OrderedDict[Tuple, Tuple[float, Dict]]' = OrderedDict()
+
+# キャッシュに有効なエントリがないことを表す番兵
+_MISSING = object()
+
+
+def _cache_get(cache: OrderedDict, key: Any, ttl: float) -> Any:
+    """
+    有効期限内のキャッシュ済みの値を返す（なければ_MISSING）
+    参照したエントリはLRUの末尾（最新）に移動する
+    """
+    entry = cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] < ttl:
+        cache.move_to_end(key)
+        return entry[1]
+    return _MISSING
+
+
+def _cache_put(cache: OrderedDict, key: Any, value: Any, max_entries: int) -> None:
+    """
+    値を現在時刻とともに保存し、max_entriesを超えたら最も長く参照されていないエントリを破棄
+    """
+    cache[key] = (time.monotonic(), value)
+    cache.move_to_end(key)
+    if len(cache) > max_entries:
+        cache.popitem(last=False)
+
+
+def _cached(key: str, ttl: float, fn: callable) -> Any:
+    """
+    fnの結果をttl秒間キャッシュして返す
+    有効期限内であればfnを呼ばずにキャッシュ済みの値を返す
+    """
+    value = _cache_get(_CACHE, key, ttl)
+    if value is _MISSING:
+        value = fn()
+        _cache_put(_CACHE, key, value, CACHE_MAX_ENTRIES)
+    return value
+
+
+def response_cache(ttl: float) -> Callable:
+    """
+    ルートハンドラーのレスポンス（JSON直列化済み）をパス・クエリパラメータの組み合わせごとにttl秒間キャッシュするデコレーター
+    正常レスポンス（200）のみキャッシュし、バリデーションエラーやDBエラー、本文が大きすぎるレスポンスはキャッシュしない
+    """
+    def decorator(handler_fn: Callable[[Dict], Dict]) -> Callable[[Dict], Dict]:
+        @wraps(handler_fn)
+        def wrapper(event: Dict) -> Dict:
+            key = (
+                handler_fn.__name__,
+                tuple(sorted(extract_path_params(event).items())),
+                tuple(sorted(extract_query_params(event).items()))
+            )
+            response = _cache_get(_RESPONSE_CACHE, key, ttl)
+            if response is _MISSING:
+                response = handler_fn(event)
+                if response['statusCode'] == 200 and len(response['body']) <= RESPONSE_CACHE_MAX_BODY_SIZE:
+                    _cache_put(_RESPONSE_CACHE, key, response, RESPONSE_CACHE_MAX_ENTRIES)
+            return response
+        return wrapper
+    return decorator
+
+
 # ============================================================================
 # DynamoDBクエリ関数
 # ============================================================================
 
+def deserialize_value(value: Dict[str, Any]) -> Any:
+    """
+    DynamoDB JSON形式の属性値1つをPythonの値に変換
+    数値（N型）はレスポンスでfloatとして返すため、Decimalを経由せず直接floatに変換する
+    マップ（M型）・リスト（L型）の中の数値も同様に変換するため、再帰的に処理する
+    """
+    if 'N' in value:
+        return float(value['N'])
+    if 'M' in value:
+        return deserialize_item(value['M'])
+    if 'L' in value:
+        return [deserialize_value(element) for element in value['L']]
+    if 'NS' in value:
+        return set(map(float, value['NS']))
+    return deserializer.deserialize(value)
+
+
+def deserialize_item(item: Dict[str, Dict]) -> Dict[str, Any]:
+    """
+    低レベルクライアントが返すDynamoDB JSON形式（{'S': ...}など）のアイテムをPythonの値に変換
+    """
+    return {name: deserialize_value(value) for name, value in item.items()}
+
+
+# (start_timeの有無, end_timeの有無) ごとのtimestamp（ソートキー）条件
+SORT_KEY_CONDITIONS = {
+    (True, True): ' AND #ts BETWEEN :start_time AND :end_time',
+    (True, False): ' AND #ts >= :start_time',
+    (False, True): ' AND #ts <= :end_time',
+    (False, False): '',
+}
+
+# パーティションキーと時間範囲の組み合わせごとのKeyConditionExpressionを事前に組み立てておく
+KEY_CONDITIONS = {
+    (partition_key, *time_range): f'{partition_key} = :pk{condition}'
+    for partition_key in ('device_id', 'room_id')
+    for time_range, condition in SORT_KEY_CONDITIONS.items()
+}
+
+
+def key_condition_params(partition_key: str, partition_value: str, start_time: Optional[str] = None,
+                         end_time: Optional[str] = None) -> Dict[str, Any]:
+    """
+    パーティションキーとtimestamp（ソートキー）の範囲からKeyConditionExpressionのクエリパラメータを作成
+    timestampは予約語のため属性名プレースホルダー#tsで参照する
+    """
+    query_params = {
+        'KeyConditionExpression': KEY_CONDITIONS[partition_key, bool(start_time), bool(end_time)],
+        'ExpressionAttributeValues': {':pk': {'S': partition_value}}
+    }
+    if start_time or end_time:
+        query_params['ExpressionAttributeNames'] = {'#ts': 'timestamp'}
+    if start_time:
+        query_params['ExpressionAttributeValues'][':start_time'] = {'S': start_time}
+    if end_time:
+        query_params['ExpressionAttributeValues'][':end_time'] = {'S': end_time}
+
+    return query_params
+
+
+def add_filter_expression(query_params: Dict[str, Any], filters: Dict[str, Optional[str]]) -> Dict[str, Any]:
+    """
+    属性名と値の組を等価条件のFilterExpression（AND結合）としてクエリパラメータに追加
+    値が指定されていない条件は無視する
+    """
+    conditions = []
+    for name, value in filters.items():
+        if value:
+            conditions.append(f'{name} = :{name}')
+            query_params['ExpressionAttributeValues'][f':{name}'] = {'S': value}
+
+    if conditions:
+        query_params['FilterExpression'] = ' AND '.join(conditions)
+    return query_params
+
+
+def scan_pages(**scan_params) -> Iterator[Dict]:
+    """
+    テーブルをページ単位でスキャンし、アイテムを順に返す
+    1回のScanは1MBで打ち切られるため、LastEvaluatedKeyがなくなるまで続きを取得する
+    """
+    while True:
+        response = client.scan(TableName=TABLE_NAME, **scan_params)
+        yield from map(deserialize_item, response.get('Items', []))
+
+        last_evaluated_key = response.get('LastEvaluatedKey')
+        if not last_evaluated_key:
+            return
+        scan_params['ExclusiveStartKey'] = last_evaluated_key
+
+
+def parallel_scan(**scan_params) -> List[Dict]:
+    """
+    Segment/TotalSegmentsでテーブルを分割し、各セグメントを並列にスキャン
+    アイテムの順序はセグメント順（テーブル全体としての順序は保証されない）
+    """
+    def scan_segment(segment: int) -> List[Dict]:
+        return list(scan_pages(Segment=segment, TotalSegments=SCAN_SEGMENTS, **scan_params))
+
+    futures = [scan_executor.submit(scan_segment, segment) for segment in range(SCAN_SEGMENTS)]
+    return [item for future in futures for item in future.result()]
+
+
+def parallel_scan_unique(attribute: str) -> Set[str]:
+    """
+    指定属性のみプロジェクションして並列スキャンし、ユニークな値の集合を返す
+    各セグメントはページを読みながら集合に積み上げ、全アイテムのリストは作らない
+    """
+    def scan_segment(segment: int) -> Set[str]:
+        return set(item[attribute] for item in scan_pages(
+            ProjectionExpression=attribute, Segment=segment, TotalSegments=SCAN_SEGMENTS
+        ))
+
+    futures = [scan_executor.submit(scan_segment, segment) for segment in range(SCAN_SEGMENTS)]
+    return set().union(*(future.result() for future in futures))
+
+
 def query_all_devices() -> List[Dict]:
     """
     テーブル全体をスキャン - 大きなテーブルでは高コスト
+    APIレスポンスに含める属性のみプロジェクションし、セグメントごとに並列で全ページを取得
     """
     try:
-        response = table.scan()
-        return response.get('Items', [])
+        return parallel_scan(**TELEMETRY_PROJECTION)
+    except Exception as e:
+        raise Exception(f"Database query failed: {str(e)}")
+
+
+def encode_page_token(last_evaluated_key: Dict[str, Dict]) -> str:
+    """
+    ScanのLastEvaluatedKey（DynamoDB JSON形式）をURLに埋め込めるページトークンに変換
+    """
+    return base64.urlsafe_b64encode(json.dumps(last_evaluated_key, separators=(',', ':')).encode()).decode()
+
+
+def decode_page_token(page_token: str) -> Optional[Dict[str, Dict]]:
+    """
+    ページトークンをExclusiveStartKeyに戻す
+    テーブルのキー（device_id, timestamp）の文字列属性だけからなる場合のみ有効とし、それ以外はNoneを返す
+    """
+    try:
+        start_key = json.loads(base64.urlsafe_b64decode(page_token.encode()))
+    except (ValueError, TypeError):
+        return None
+
+    if not isinstance(start_key, dict) or set(start_key) != {'device_id', 'timestamp'}:
+        return None
+    if not all(isinstance(value, dict) and list(value) == ['S'] and isinstance(value['S'], str)
+               for value in start_key.values()):
+        return None
+    return start_key
+
+
+def query_devices_page(limit: int, page_token: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+    """
+    テーブルを1ページ分だけスキャン - 全件スキャンを避けたいクライアント向け
+    Returns: (アイテムリスト, 次ページのトークン。最終ページではNone)
+    """
+    try:
+        scan_params = dict(TELEMETRY_PROJECTION, Limit=limit)
+        if page_token:
+            scan_params['ExclusiveStartKey'] = decode_page_token(page_token)
+
+        response = client.scan(TableName=TABLE_NAME, **scan_params)
+        items = [deserialize_item(item) for item in response.get('Items', [])]
+
+        last_evaluated_key = response.get('LastEvaluatedKey')
+        return items, encode_page_token(last_evaluated_key) if last_evaluated_key else None
     except Exception as e:
         raise Exception(f"Database query failed: {str(e)}")
 
@@ -146,87 +497,56 @@ def query_device_by_id(device_id: str, start_time: Optional[str] = None,
     device_id（パーティションキー）でクエリ、timestampとstatusでフィルタ
     """
     try:
-        key_condition = Key('device_id').eq(device_id)
-
-        # timestampはソートキーなのでKeyConditionExpressionで効率的にフィルタ
-        if start_time and end_time:
-            key_condition = key_condition & Key('timestamp').between(start_time, end_time)
-        elif start_time:
-            key_condition = key_condition & Key('timestamp').gte(start_time)
-        elif end_time:
-            key_condition = key_condition & Key('timestamp').lte(end_time)
-
-        query_params = {'KeyConditionExpression': key_condition}
+        query_params = key_condition_params('device_id', device_id, start_time, end_time)
 
         # statusはFilterExpressionで後からフィルタ（キー条件後に適用）
-        if status:
-            query_params['FilterExpression'] = Attr('device_status').eq(status)
+        add_filter_expression(query_params, {'device_status': status})
 
-        response = table.query(**query_params)
-        return response.get('Items', [])
+        response = client.query(TableName=TABLE_NAME, **query_params)
+        return [deserialize_item(item) for item in response.get('Items', [])]
     except Exception as e:
         raise Exception(f"Device query failed: {str(e)}")
 
 
-def query_room_by_id(room_id: str, start_time: Optional[str] = None,
-                     end_time: Optional[str] = None) -> List[Dict]:
+def query_room_by_id(room_id: str, start_time: Optional[str] = None, end_time: Optional[str] = None,
+                     fields: Optional[List[str]] = None) -> List[Dict]:
     """
     GSIを使用してroom_idでクエリ - 部屋内の全デバイスデータを取得
+    fieldsを指定した場合はその属性のみプロジェクションして通信量を削減
     """
     try:
-        key_condition = Key('room_id').eq(room_id)
-
         # GSIのソートキー（timestamp）でフィルタ
-        if start_time and end_time:
-            key_condition = key_condition & Key('timestamp').between(start_time, end_time)
-        elif start_time:
-            key_condition = key_condition & Key('timestamp').gte(start_time)
-        elif end_time:
-            key_condition = key_condition & Key('timestamp').lte(end_time)
-
-        response = table.query(
-            IndexName=GSI_NAME,
-            KeyConditionExpression=key_condition
-        )
-        return response.get('Items', [])
+        query_params = key_condition_params('room_id', room_id, start_time, end_time)
+
+        if fields:
+            query_params['ProjectionExpression'] = ', '.join(f'#{field}' for field in fields)
+            query_params.setdefault('ExpressionAttributeNames', {}).update({f'#{field}': field for field in fields})
+
+        response = client.query(TableName=TABLE_NAME, IndexName=GSI_NAME, **query_params)
+        return [deserialize_item(item) for item in response.get('Items', [])]
     except Exception as e:
         raise Exception(f"Room query failed: {str(e)}")
 
 
-def query_room_device_specific(room_id: str, device_id: str, start_time: Optional[str] = None,
-                               end_time: Optional[str] = None, status: Optional[str] = None) -> List[Dict]:
+def count_room_items(room_id: str, start_time: Optional[str] = None, end_time: Optional[str] = None) -> int:
     """
-    GSIでroom_idクエリ後、device_idとstatusでフィルタ
+    GSIを使用して部屋内のデータ件数のみ取得 - Select='COUNT'でアイテム本体は転送しない
+    COUNTでも1回のQueryは読み取り1MBで打ち切られるため、LastEvaluatedKeyがなくなるまで件数を合計する
     """
     try:
-        key_condition = Key('room_id').eq(room_id)
-
-        if start_time and end_time:
-            key_condition = key_condition & Key('timestamp').between(start_time, end_time)
-        elif start_time:
-            key_condition = key_condition & Key('timestamp').gte(start_time)
-        elif end_time:
-            key_condition = key_condition & Key('timestamp').lte(end_time)
-
-        query_params = {
-            'IndexName': GSI_NAME,
-            'KeyConditionExpression': key_condition
-        }
-
-        # device_idとstatusはFilterExpressionで適用
-        filter_expressions = [Attr('device_id').eq(device_id)]
-        if status:
-            filter_expressions.append(Attr('device_status').eq(status))
-
-        if len(filter_expressions) == 1:
-            query_params['FilterExpression'] = filter_expressions[0]
-        else:
-            query_params['FilterExpression'] = filter_expressions[0] & filter_expressions[1]
-
-        response = table.query(**query_params)
-        return response.get('Items', [])
+        query_params = key_condition_params('room_id', room_id, start_time, end_time)
+
+        count = 0
+        while True:
+            response = client.query(TableName=TABLE_NAME, IndexName=GSI_NAME, Select='COUNT', **query_params)
+            count += response['Count']
+
+            last_evaluated_key = response.get('LastEvaluatedKey')
+            if not last_evaluated_key:
+                return count
+            query_params['ExclusiveStartKey'] = last_evaluated_key
     except Exception as e:
-        raise Exception(f"Room-device query failed: {str(e)}")
+        raise Exception(f"Room query failed: {str(e)}")
 
 
 def query_device_room_info(device_id: str) -> List[str]:
@@ -235,12 +555,13 @@ def query_device_room_info(device_id: str) -> List[str]:
     room_idのみプロジェクションして通信量を削減
     """
     try:
-        response = table.query(
-            KeyConditionExpression=Key('device_id').eq(device_id),
-            ProjectionExpression='room_id'
+        response = client.query(
+            TableName=TABLE_NAME,
+            ProjectionExpression='room_id',
+            **key_condition_params('device_id', device_id)
         )
         # setで重複除去してからソート
-        rooms = set(item['room_id'] for item in response.get('Items', []))
+        rooms = set(deserialize_item(item)['room_id'] for item in response.get('Items', []))
         return sorted(list(rooms))
     except Exception as e:
         raise Exception(f"Device room query failed: {str(e)}")
@@ -253,73 +574,80 @@ def query_device_in_specific_room(device_id: str, room_id: str, start_time: Opti
     デバイス中心のクエリではGSIより効率的
     """
     try:
-        key_condition = Key('device_id').eq(device_id)
-
-        if start_time and end_time:
-            key_condition = key_condition & Key('timestamp').between(start_time, end_time)
-        elif start_time:
-            key_condition = key_condition & Key('timestamp').gte(start_time)
-        elif end_time:
-            key_condition = key_condition & Key('timestamp').lte(end_time)
-
-        query_params = {'KeyConditionExpression': key_condition}
+        query_params = key_condition_params('device_id', device_id, start_time, end_time)
 
         # room_idとstatusをFilterExpressionで適用
-        filter_expressions = [Attr('room_id').eq(room_id)]
-        if status:
-            filter_expressions.append(Attr('device_status').eq(status))
-
-        if len(filter_expressions) == 1:
-            query_params['FilterExpression'] = filter_expressions[0]
-        else:
-            query_params['FilterExpression'] = filter_expressions[0] & filter_expressions[1]
+        add_filter_expression(query_params, {'room_id': room_id, 'device_status': status})
 
-        response = table.query(**query_params)
-        return response.get('Items', [])
+        response = client.query(TableName=TABLE_NAME, **query_params)
+        return [deserialize_item(item) for item in response.get('Items', [])]
     except Exception as e:
         raise Exception(f"Device-room query failed: {str(e)}")
 
 
 def get_unique_rooms() -> List[str]:
     """
-    全ユニーク部屋IDを取得 - room_idのみプロジェクションして通信量削減
+    全ユニーク部屋IDを取得 - 結果はROOMS_CACHE_TTL_SECONDSの間キャッシュ
+    """
+    return _cached('rooms', ROOMS_CACHE_TTL_SECONDS, _scan_unique_rooms)
+
+
+def _scan_unique_rooms() -> List[str]:
+    """
+    全ユニーク部屋IDを並列スキャン - room_idのみプロジェクションして通信量削減
     """
     try:
-        response = table.scan(
-            ProjectionExpression='room_id'
-        )
-        rooms = set(item['room_id'] for item in response.get('Items', []))
-        return sorted(list(rooms))
+        return sorted(parallel_scan_unique('room_id'))
     except Exception as e:
         raise Exception(f"Room scan failed: {str(e)}")
 
 
 def get_unique_devices() -> List[str]:
     """
-    全ユニークデバイスIDを取得 - device_idのみプロジェクションして通信量削減
+    全ユニークデバイスIDを取得 - 結果はDEVICES_CACHE_TTL_SECONDSの間キャッシュ
+    """
+    return _cached('devices', DEVICES_CACHE_TTL_SECONDS, _scan_unique_devices)
+
+
+def _scan_unique_devices() -> List[str]:
+    """
+    全ユニークデバイスIDを並列スキャン - device_idのみプロジェクションして通信量削減
     """
     try:
-        response = table.scan(
-            ProjectionExpression='device_id'
-        )
-        devices = set(item['device_id'] for item in response.get('Items', []))
-        return sorted(list(devices))
+        return sorted(parallel_scan_unique('device_id'))
     except Exception as e:
         raise Exception(f"Device scan failed: {str(e)}")
 
 
+def get_device_rooms(device_id: str) -> List[str]:
+    """
+    特定デバイスが配置されている全部屋IDを取得 - 結果はデバイスごとにDEVICE_ROOMS_CACHE_TTL_SECONDSの間キャッシュ
+    """
+    return _cached(f'device_rooms:{device_id}', DEVICE_ROOMS_CACHE_TTL_SECONDS,
+                   partial(query_device_room_info, device_id))
+
+
 def get_devices_in_room(room_id: str) -> List[Dict]:
     """
-    特定部屋の全ユニークデバイスを取得
+    特定部屋の全ユニークデバイスを取得 - 結果は部屋ごとにROOM_DEVICES_CACHE_TTL_SECONDSの間キャッシュ
+    """
+    return _cached(f'room_devices:{room_id}', ROOM_DEVICES_CACHE_TTL_SECONDS,
+                   partial(_query_devices_in_room, room_id))
+
+
+def _query_devices_in_room(room_id: str) -> List[Dict]:
+    """
+    特定部屋の全ユニークデバイスをクエリ
     GSIでroom_idクエリ、device_idのみプロジェクション
     """
     try:
-        response = table.query(
+        response = client.query(
+            TableName=TABLE_NAME,
             IndexName=GSI_NAME,
-            KeyConditionExpression=Key('room_id').eq(room_id),
-            ProjectionExpression='device_id'
+            ProjectionExpression='device_id',
+            **key_condition_params('room_id', room_id)
         )
-        devices = set(item['device_id'] for item in response.get('Items', []))
+        devices = set(deserialize_item(item)['device_id'] for item in response.get('Items', []))
         return [{'device_id': device} for device in sorted(devices)]
     except Exception as e:
         raise Exception(f"Room devices query failed: {str(e)}")
@@ -329,38 +657,41 @@ def get_devices_in_room(room_id: str) -> List[Dict]:
 # レスポンス整形関数
 # ============================================================================
 
-def decimal_to_float(obj):
+# エンコーダーは状態を持たないため、json.dumpsのように呼び出しごとに作らずモジュールレベルで1つだけ作成
+json_encoder = json.JSONEncoder(separators=(',', ':'))
+
+
+def encode_json(body: Any) -> str:
     """
-    DynamoDB Decimalオブジェクトをfloatに再帰変換
-    DynamoDBの数値はDecimal型でJSON直列化できないため
+    レスポンスボディをコンパクトなJSON文字列に変換
+    orjsonがあればC実装で直列化し、なければ標準のjsonを使用
+    数値はデシリアライズ時にfloatへ変換済みのため、Decimal用のフックは不要
     """
-    if isinstance(obj, Decimal):
-        return float(obj)
-    elif isinstance(obj, dict):
-        return {k: decimal_to_float(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [decimal_to_float(item) for item in obj]
-    return obj
+    if orjson is not None:
+        return orjson.dumps(body).decode()
+    return json_encoder.encode(body)
+
+
+# 全レスポンス共通のヘッダー（CORS含む）
+# 追加ヘッダーがないレスポンスではこの辞書をそのまま共有するため、変更しないこと
+# （Lambdaランタイムがレスポンスをjson.dumpsで直列化するため、MappingProxyTypeではなく通常の辞書にしている）
+DEFAULT_HEADERS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type, Authorization'
+}
 
 
 def create_response(status_code: int, body: Any, headers: Optional[Dict] = None) -> Dict:
     """
     API Gateway標準レスポンス形式を作成、CORSヘッダー付き
+    追加ヘッダーが指定された場合のみ共通ヘッダーをコピーしてマージする
     """
-    default_headers = {
-        'Content-Type': 'application/json',
-        'Access-Control-Allow-Origin': '*',
-        'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
-        'Access-Control-Allow-Headers': 'Content-Type, Authorization'
-    }
-
-    if headers:
-        default_headers.update(headers)
-
     return {
         'statusCode': status_code,
-        'headers': default_headers,
-        'body': json.dumps(decimal_to_float(body))  # Decimal変換してJSON化
+        'headers': {**DEFAULT_HEADERS, **headers} if headers else DEFAULT_HEADERS,
+        'body': encode_json(body)  # コンパクトにJSON化
     }
 
 
@@ -380,10 +711,26 @@ def create_error_response(status_code: int, message: str, errors: Optional[List]
 # ============================================================================
 
 def handle_root(event: Dict) -> Dict:
-    """GET / - 全テレメトリーデータ取得（大量データでは高コスト）"""
+    """
+    GET / - 全テレメトリーデータ取得（大量データでは高コスト）
+    limitまたはpage_tokenが指定された場合は1ページ分だけ返し、続きがあればnext_page_tokenを付ける
+    """
+    query_params = extract_query_params(event)
+
+    error_response = validate_request({}, (), query_params, PAGINATION_QUERY_VALIDATORS)
+    if error_response:
+        return error_response
+
     try:
-        data = query_all_devices()
-        return create_response(200, {'data': data, 'count': len(data)})
+        limit = query_params.get('limit')
+        page_token = query_params.get('page_token')
+
+        if limit is None and page_token is None:
+            data = query_all_devices()
+            return create_response(200, {'data': data, 'count': len(data)})
+
+        data, next_page_token = query_devices_page(int(limit or DEFAULT_PAGE_LIMIT), page_token)
+        return create_response(200, {'data': data, 'count': len(data), 'next_page_token': next_page_token})
     except Exception as e:
         return create_error_response(500, f"Failed to retrieve data: {str(e)}")
 
@@ -397,6 +744,7 @@ def handle_devices_list(event: Dict) -> Dict:
         return create_error_response(500, f"Failed to retrieve devices: {str(e)}")
 
 
+@response_cache(RESPONSE_CACHE_TTL_SECONDS)
 def handle_device_detail(event: Dict) -> Dict:
     """GET /devices/{device_id} - 特定デバイスのテレメトリーデータ取得"""
     path_params = extract_path_params(event)
@@ -404,31 +752,16 @@ def handle_device_detail(event: Dict) -> Dict:
 
     device_id = path_params.get('device_id')
 
-    # パスパラメータ検証
-    validators = {'device_id': validate_device_id}
-    is_valid, errors = validate_params({'device_id': device_id}, validators)
-
-    if not is_valid:
-        return create_error_response(400, "Validation failed", errors)
+    # パスパラメータ・クエリパラメータ検証
+    error_response = validate_request(path_params, DEVICE_PATH_VALIDATORS, query_params, TELEMETRY_QUERY_VALIDATORS)
+    if error_response:
+        return error_response
 
     # クエリパラメータ抽出
     start_time = query_params.get('start_time')
     end_time = query_params.get('end_time')
     status = query_params.get('status')
 
-    # クエリパラメータ検証
-    optional_validators = {
-        'start_time': validate_timestamp,
-        'end_time': validate_timestamp,
-        'status': validate_status
-    }
-
-    optional_params = {k: v for k, v in query_params.items() if v is not None}
-    is_valid, errors = validate_params(optional_params, optional_validators)
-
-    if not is_valid:
-        return create_error_response(400, "Query parameter validation failed", errors)
-
     try:
         data = query_device_by_id(device_id, start_time, end_time, status)
         return create_response(200, {'device_id': device_id, 'data': data, 'count': len(data)})
@@ -441,14 +774,12 @@ def handle_device_rooms(event: Dict) -> Dict:
     path_params = extract_path_params(event)
     device_id = path_params.get('device_id')
 
-    validators = {'device_id': validate_device_id}
-    is_valid, errors = validate_params({'device_id': device_id}, validators)
-
-    if not is_valid:
-        return create_error_response(400, "Validation failed", errors)
+    error_response = validate_request(path_params, DEVICE_PATH_VALIDATORS)
+    if error_response:
+        return error_response
 
     try:
-        rooms = query_device_room_info(device_id)
+        rooms = get_device_rooms(device_id)
         return create_response(200, {
             'device_id': device_id,
             'rooms': rooms,
@@ -458,6 +789,7 @@ def handle_device_rooms(event: Dict) -> Dict:
         return create_error_response(500, f"Failed to retrieve device rooms: {str(e)}")
 
 
+@response_cache(RESPONSE_CACHE_TTL_SECONDS)
 def handle_device_room_detail(event: Dict) -> Dict:
     """GET /devices/{device_id}/{room_id} - 特定デバイスの特定部屋データ取得"""
     path_params = extract_path_params(event)
@@ -466,31 +798,15 @@ def handle_device_room_detail(event: Dict) -> Dict:
     device_id = path_params.get('device_id')
     room_id = path_params.get('room_id')
 
-    validators = {
-        'device_id': validate_device_id,
-        'room_id': validate_room_id
-    }
-    is_valid, errors = validate_params({'device_id': device_id, 'room_id': room_id}, validators)
-
-    if not is_valid:
-        return create_error_response(400, "Validation failed", errors)
+    error_response = validate_request(path_params, DEVICE_ROOM_PATH_VALIDATORS,
+                                      query_params, TELEMETRY_QUERY_VALIDATORS)
+    if error_response:
+        return error_response
 
     start_time = query_params.get('start_time')
     end_time = query_params.get('end_time')
     status = query_params.get('status')
 
-    optional_validators = {
-        'start_time': validate_timestamp,
-        'end_time': validate_timestamp,
-        'status': validate_status
-    }
-
-    optional_params = {k: v for k, v in query_params.items() if v is not None}
-    is_valid, errors = validate_params(optional_params, optional_validators)
-
-    if not is_valid:
-        return create_error_response(400, "Query parameter validation failed", errors)
-
     try:
         # デバイスパーティションキー使用で効率的
         data = query_device_in_specific_room(device_id, room_id, start_time, end_time, status)
@@ -513,36 +829,35 @@ def handle_rooms_list(event: Dict) -> Dict:
         return create_error_response(500, f"Failed to retrieve rooms: {str(e)}")
 
 
+@response_cache(RESPONSE_CACHE_TTL_SECONDS)
 def handle_room_detail(event: Dict) -> Dict:
-    """GET /rooms/{room_id} - 特定部屋の全デバイステレメトリーデータ取得"""
+    """
+    GET /rooms/{room_id} - 特定部屋の全デバイステレメトリーデータ取得
+    summary=trueの場合は件数のみ、fieldsを指定した場合は指定属性のみ返す
+    """
     path_params = extract_path_params(event)
     query_params = extract_query_params(event)
 
     room_id = path_params.get('room_id')
 
-    validators = {'room_id': validate_room_id}
-    is_valid, errors = validate_params({'room_id': room_id}, validators)
-
-    if not is_valid:
-        return create_error_response(400, "Validation failed", errors)
+    error_response = validate_request(path_params, ROOM_PATH_VALIDATORS, query_params, ROOM_QUERY_VALIDATORS)
+    if error_response:
+        return error_response
 
     start_time = query_params.get('start_time')
     end_time = query_params.get('end_time')
+    fields = query_params.get('fields')
 
-    optional_validators = {
-        'start_time': validate_timestamp,
-        'end_time': validate_timestamp
-    }
-
-    optional_params = {k: v for k, v in query_params.items() if v is not None}
-    is_valid, errors = validate_params(optional_params, optional_validators)
-
-    if not is_valid:
-        return create_error_response(400, "Query parameter validation failed", errors)
+    # 重複して指定された属性は1回だけプロジェクション
+    field_list = list(dict.fromkeys(fields.split(','))) if fields else None
 
     try:
         # GSI使用で部屋ベースクエリ
-        data = query_room_by_id(room_id, start_time, end_time)
+        if query_params.get('summary') == 'true':
+            count = count_room_items(room_id, start_time, end_time)
+            return create_response(200, {'room_id': room_id, 'count': count})
+
+        data = query_room_by_id(room_id, start_time, end_time, field_list)
         return create_response(200, {'room_id': room_id, 'data': data, 'count': len(data)})
     except Exception as e:
         return create_error_response(500, f"Failed to retrieve room data: {str(e)}")
@@ -553,11 +868,9 @@ def handle_room_devices(event: Dict) -> Dict:
     path_params = extract_path_params(event)
     room_id = path_params.get('room_id')
 
-    validators = {'room_id': validate_room_id}
-    is_valid, errors = validate_params({'room_id': room_id}, validators)
-
-    if not is_valid:
-        return create_error_response(400, "Validation failed", errors)
+    error_response = validate_request(path_params, ROOM_PATH_VALIDATORS)
+    if error_response:
+        return error_response
 
     try:
         devices = get_devices_in_room(room_id)
@@ -566,6 +879,7 @@ def handle_room_devices(event: Dict) -> Dict:
         return create_error_response(500, f"Failed to retrieve room devices: {str(e)}")
 
 
+@response_cache(RESPONSE_CACHE_TTL_SECONDS)
 def handle_room_device_detail(event: Dict) -> Dict:
     """GET /rooms/{room_id}/{device_id} - 特定部屋の特定デバイスデータ取得"""
     path_params = extract_path_params(event)
@@ -574,34 +888,19 @@ def handle_room_device_detail(event: Dict) -> Dict:
     room_id = path_params.get('room_id')
     device_id = path_params.get('device_id')
 
-    validators = {
-        'room_id': validate_room_id,
-        'device_id': validate_device_id
-    }
-    is_valid, errors = validate_params({'room_id': room_id, 'device_id': device_id}, validators)
-
-    if not is_valid:
-        return create_error_response(400, "Validation failed", errors)
+    error_response = validate_request(path_params, ROOM_DEVICE_PATH_VALIDATORS,
+                                      query_params, TELEMETRY_QUERY_VALIDATORS)
+    if error_response:
+        return error_response
 
     start_time = query_params.get('start_time')
     end_time = query_params.get('end_time')
     status = query_params.get('status')
 
-    optional_validators = {
-        'start_time': validate_timestamp,
-        'end_time': validate_timestamp,
-        'status': validate_status
-    }
-
-    optional_params = {k: v for k, v in query_params.items() if v is not None}
-    is_valid, errors = validate_params(optional_params, optional_validators)
-
-    if not is_valid:
-        return create_error_response(400, "Query parameter validation failed", errors)
-
     try:
-        # GSI使用で部屋ベースクエリ
-        data = query_room_device_specific(room_id, device_id, start_time, end_time, status)
+        # 部屋中心のURLでも、GSIで部屋内の全データを読んでからdevice_idで絞り込むより、
+        # デバイスのパーティションキーでクエリしてroom_idで絞り込む方が読み取り件数が少ない
+        data = query_device_in_specific_room(device_id, room_id, start_time, end_time, status)
         return create_response(200, {
             'room_id': room_id,
             'device_id': device_id,
@@ -616,16 +915,20 @@ def handle_room_device_detail(event: Dict) -> Dict:
 # ルーティング設定
 # ============================================================================
 
+# HTTPメソッド -> リソースパス -> ハンドラー
+# メソッドごとに分けておき、リクエストごとにタプルのキーを作らず文字列キーの辞書引きだけで解決する
 ROUTE_HANDLERS = {
-    ('GET', '/'): handle_root,
-    ('GET', '/devices'): handle_devices_list,
-    ('GET', '/devices/{device_id}'): handle_device_detail,
-    ('GET', '/devices/{device_id}/rooms'): handle_device_rooms,
-    ('GET', '/devices/{device_id}/{room_id}'): handle_device_room_detail,
-    ('GET', '/rooms'): handle_rooms_list,
-    ('GET', '/rooms/{room_id}'): handle_room_detail,
-    ('GET', '/rooms/{room_id}/devices'): handle_room_devices,
-    ('GET', '/rooms/{room_id}/{device_id}'): handle_room_device_detail,
+    'GET': {
+        '/': handle_root,
+        '/devices': handle_devices_list,
+        '/devices/{device_id}': handle_device_detail,
+        '/devices/{device_id}/rooms': handle_device_rooms,
+        '/devices/{device_id}/{room_id}': handle_device_room_detail,
+        '/rooms': handle_rooms_list,
+        '/rooms/{room_id}': handle_room_detail,
+        '/rooms/{room_id}/devices': handle_room_devices,
+        '/rooms/{room_id}/{device_id}': handle_room_device_detail,
+    },
 }
 
 
@@ -638,8 +941,8 @@ def handler(event: Dict, context: Any) -> Dict:
         resource_path = event.get('resource', '/')
 
         # ルート解決
-        route_key = (http_method, resource_path)
-        route_handler = ROUTE_HANDLERS.get(route_key)
+        method_routes = ROUTE_HANDLERS.get(http_method)
+        route_handler = method_routes.get(resource_path) if method_routes else None
 
         if not route_handler:
             return create_error_response(404, f"Route not found: {http_method} {resource_path}")